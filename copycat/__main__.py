@@ -1,37 +1,65 @@
 """Run the copycat program"""
+
+import argparse
 import logging
 import sys
 
 from . import copycat
 
 
+def parse_args(args):
+    parser = argparse.ArgumentParser(prog="copycat", description=__doc__)
+    parser.add_argument("initial", help="a word to be changed, e.g. abc")
+    parser.add_argument("modified", help="that word after a change, e.g. abd")
+    parser.add_argument("target", help="a word to change in the same way, e.g. ijk")
+    parser.add_argument(
+        "iterations", nargs="?", type=int, default=1, help="how many trials to run"
+    )
+    parser.add_argument(
+        "--seed", type=int, help="seed the random numbers, to repeat a run"
+    )
+    parser.add_argument(
+        "--margin",
+        type=float,
+        help="stop once the leading answer's share is known within this margin",
+    )
+    parser.add_argument(
+        "--seconds", type=float, help="with --margin, stop after this long anyway"
+    )
+    return parser.parse_args(args)
+
+
 def main():
     """Run the program"""
     logging.basicConfig(
         level=logging.WARN, format="%(message)s", filename="./copycat.log", filemode="w"
     )
-
-    program, *args = sys.argv
-    try:
-        if len(args) == 4:
-            initial, modified, target = args[:-1]
-            iterations = int(args[-1])
-        else:
-            initial, modified, target = args
-            iterations = 1
-        answers = copycat.run(initial, modified, target, iterations)
-        for answer, values in sorted(answers.items(), key=lambda kv: kv[1]["avgtemp"]):
-            average_time = round(values["avgtime"] / 1000.0, 2)
-            average_temperature = round(values["avgtemp"], 2)
-            print(
-                f"{answer}: {values['count']} "
-                f"(average time {average_time} seconds, "
-                f"average temperature {average_temperature})"
-            )
-        return 0
-    except ValueError:
-        print(f"Usage: {program} initial modified target [iterations]", file=sys.stderr)
-        return 1
+    args = parse_args(sys.argv[1:])
+    if args.margin is None:
+        answers = copycat.run(
+            args.initial, args.modified, args.target, args.iterations, seed=args.seed
+        )
+    else:
+        answers = copycat.run_until_confident(
+            args.initial,
+            args.modified,
+            args.target,
+            args.iterations,
+            args.margin,
+            seconds=args.seconds,
+            seed=args.seed,
+        )
+        trials = sum(_["count"] for _ in answers.values())
+        print(f"Stopped after {trials} of {args.iterations} trials")
+    for answer, values in sorted(answers.items(), key=lambda kv: kv[1]["avgtemp"]):
+        average_time = round(values["avgtime"] / 1000.0, 2)
+        average_temperature = round(values["avgtemp"], 2)
+        print(
+            f"{answer}: {values['count']} "
+            f"(average time {average_time} seconds, "
+            f"average temperature {average_temperature})"
+        )
+    return 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,159 @@
+"""Run many analogy problems on one engine, reading them from a file
+
+Each problem is a line of CSV
+    initial,modified,target[,iterations[,seed]]
+or a line of JSON (as in a "JSON lines" file)
+    {"initial": "abc", "modified": "abd", "target": "ijk", "iterations": 10}
+
+The slipnet and workspace are made once, and reused for every problem
+With a margin, the trials of each problem stop once the leading answer's share
+    is known within that margin (see copycat.run_until_confident())
+As the trials of each problem finish a line of JSON is written
+    with the problem, the answers and how long the trials took
+Lines which are not a problem are reported as errors, and skipped
+
+    $ python -m copycat.batch problems.csv > results.jsonl
+    $ python -m copycat.batch --iterations 10 --seed 42 < problems.jsonl
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+
+from . import copycat
+from .engine import Engine
+
+FIELDS = ("initial", "modified", "target", "iterations", "seed")
+
+
+def parse_problem(line, iterations=1, seed=None):
+    """The problem on a line of CSV or JSON, or None if there is none
+
+    Problems without iterations or seed are given those defaults
+    Blank lines, comments (#...) and a CSV header are not problems
+    Lines with other than lowercase words, or whole numbers, raise ValueError
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        problem = json.loads(line)
+    else:
+        (row,) = csv.reader([line])
+        if row[0].strip() == FIELDS[0]:
+            return None
+        problem = dict(zip(FIELDS, (_.strip() for _ in row)))
+    for field in FIELDS[:3]:
+        word = problem.get(field)
+        if not (isinstance(word, str) and word.isascii() and word.isalpha()):
+            raise ValueError(f"{field} should be a word, not {word!r}")
+        if not word.islower():
+            raise ValueError(f"{field} should be lowercase, not {word!r}")
+    if problem.get("iterations") in (None, ""):
+        problem["iterations"] = iterations
+    if problem.get("seed") in (None, ""):
+        problem["seed"] = seed
+    problem["iterations"] = __whole_number(problem, "iterations")
+    if problem["iterations"] < 1:
+        raise ValueError(
+            f"iterations should be at least 1, not {problem['iterations']}"
+        )
+    if problem["seed"] is not None:
+        problem["seed"] = __whole_number(problem, "seed")
+    return problem
+
+
+def __whole_number(problem, field):
+    """The problem's field as an int, or a ValueError if it is not one"""
+    value = problem[field]
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError(f"{field} should be a whole number, not {value!r}")
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{field} should be a whole number, not {value!r}") from None
+
+
+def run_problem(engine, problem, margin=None, seconds=None):
+    """Run the trials of the problem on the engine, and report the answers"""
+    start = time.perf_counter()
+    words = problem["initial"], problem["modified"], problem["target"]
+    if margin is None:
+        answers = engine.run(*words, problem["iterations"], seed=problem["seed"])
+    else:
+        with engine.activated():
+            answers = copycat.run_until_confident(
+                *words,
+                problem["iterations"],
+                margin,
+                seconds=seconds,
+                seed=problem["seed"],
+            )
+    return {
+        **problem,
+        "answers": {str(k): v for k, v in answers.items()},
+        "trials": sum(_["count"] for _ in answers.values()),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def run_batch(
+    lines, output, iterations=1, seed=None, margin=None, seconds=None, engine=None
+):
+    """Run the problem on each line, writing a line of JSON for each
+
+    Returns the number of lines which were not problems
+    """
+    engine = engine or Engine()
+    errors = 0
+    for number, line in enumerate(lines, 1):
+        try:
+            problem = parse_problem(line, iterations, seed)
+        except ValueError as e:
+            errors += 1
+            output.write(json.dumps({"line": number, "error": str(e)}) + "\n")
+            output.flush()
+            continue
+        if problem is None:
+            continue
+        result = run_problem(engine, problem, margin, seconds)
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+    return errors
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(prog="copycat.batch", description=__doc__)
+    parser.add_argument(
+        "problems", nargs="?", default="-", help="file of problems, or - for stdin"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=1, help="trials for problems without any"
+    )
+    parser.add_argument("--seed", type=int, help="seed for problems without one")
+    parser.add_argument(
+        "--margin",
+        type=float,
+        help="stop once the leading answer's share is known within this margin",
+    )
+    parser.add_argument(
+        "--seconds", type=float, help="with --margin, most seconds per problem"
+    )
+    return parser.parse_args(args)
+
+
+def main():
+    args = parse_args(sys.argv[1:])
+    options = args.iterations, args.seed, args.margin, args.seconds
+    if args.problems == "-":
+        errors = run_batch(sys.stdin, sys.stdout, *options)
+    else:
+        with open(args.problems) as stream:
+            errors = run_batch(stream, sys.stdout, *options)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
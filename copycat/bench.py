@@ -0,0 +1,231 @@
+"""Benchmark copycat on the classic analogy problems
+
+For each problem some seeded trials are run, reporting
+    how long each trial takes, how many codelets run per second,
+    the peak memory of a trial, how often the garbage collector ran
+    and how often each answer was given
+
+The report is written as JSON, so that two runs can be compared
+When compared with an earlier report, problems whose answers were given
+    in significantly different proportions are flagged,
+    so that work on speed can not silently change what copycat does
+
+    $ python -m copycat.bench --output before.json
+    $ python -m copycat.bench --compare before.json
+"""
+
+import argparse
+import gc
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+
+from . import copycat
+from .engine import Engine
+
+PROBLEMS = (
+    ("abc", "abd", "ijk"),
+    ("abc", "abd", "xyz"),
+    ("abc", "abd", "iijjkk"),
+    ("abc", "abd", "kji"),
+    ("abc", "abd", "mrrjjj"),
+    ("aabc", "aabd", "ijkk"),
+    ("abc", "abd", "ace"),
+)
+
+
+def problem_name(problem):
+    initial, modified, target = problem
+    return f"{initial}:{modified}::{target}"
+
+
+def bench_problem(problem, trials, seed):
+    """Run the trials of one problem on a fresh engine, and report on them"""
+    engine = Engine()
+    seeds = copycat.trial_seeds(trials, seed)
+    answers = {}
+    times = []
+    collections = __collections()
+    with engine.activated():
+        engine.workspace.set_strings(*problem)
+        for trial_seed in seeds:
+            start = time.perf_counter()
+            copycat.run_trial(answers, trial_seed)
+            times += [time.perf_counter() - start]
+        collections = __collections() - collections
+        # tracing memory slows the trial, so it is measured on a rerun
+        tracemalloc.start()
+        copycat.run_trial({}, seeds[0])
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    codelets = sum(_["timesum"] for _ in answers.values())
+    return {
+        "trials": trials,
+        "wall_time": sum(times),
+        "time_per_trial": sum(times) / trials,
+        "slowest_trial": max(times),
+        "codelets_per_second": codelets / sum(times),
+        "peak_memory": peak_memory,
+        "collections_per_trial": collections / trials,
+        "answers": {str(k): v["count"] for k, v in sorted(answers.items(), key=str)},
+    }
+
+
+def __collections():
+    """How many times the garbage collector has run, in all generations"""
+    return sum(_["collections"] for _ in gc.get_stats())
+
+
+def bench(problems=PROBLEMS, trials=20, seed=0):
+    """Report on each of the problems"""
+    return {
+        "python": platform.python_version(),
+        "trials": trials,
+        "seed": seed,
+        "problems": {problem_name(_): bench_problem(_, trials, seed) for _ in problems},
+    }
+
+
+def __regularized_upper_gamma(s, x):
+    """Q(s, x), the upper incomplete gamma function over the gamma function
+
+    As in Numerical Recipes: a series below s + 1, a continued fraction above
+    """
+    if x <= 0:
+        return 1.0
+    log_prefix = s * math.log(x) - x - math.lgamma(s)
+    if x < s + 1:
+        term = total = 1.0 / s
+        denominator = s
+        while abs(term) > abs(total) * 1e-15:
+            denominator += 1
+            term *= x / denominator
+            total += term
+        return 1.0 - total * math.exp(log_prefix)
+    tiny = 1e-300
+    b = x + 1 - s
+    c = 1 / tiny
+    d = 1 / b
+    fraction = d
+    for i in range(1, 1000):
+        a = -i * (i - s)
+        b += 2
+        d = a * d + b
+        d = 1 / (d if abs(d) > tiny else tiny)
+        c = b + a / c
+        c = c if abs(c) > tiny else tiny
+        fraction *= d * c
+        if abs(d * c - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * fraction
+
+
+def chi_square_survival(statistic, degrees_of_freedom):
+    """Chance of a chi-square statistic at least that large"""
+    return __regularized_upper_gamma(degrees_of_freedom / 2, statistic / 2)
+
+
+def g_test(counts, other_counts):
+    """Test whether two histograms of answers differ, by a G-test
+
+    Returns the statistic, and the chance of one at least that large
+        if both histograms were drawn from the same distribution
+    """
+    answers = sorted(set(counts) | set(other_counts))
+    rows = [[_.get(answer, 0) for answer in answers] for _ in (counts, other_counts)]
+    row_totals = [sum(_) for _ in rows]
+    column_totals = [sum(_) for _ in zip(*rows)]
+    total = sum(row_totals)
+    degrees_of_freedom = len(answers) - 1
+    if not degrees_of_freedom or not all(row_totals):
+        return 0.0, 1.0
+    statistic = 0.0
+    for row, row_total in zip(rows, row_totals):
+        for observed, column_total in zip(row, column_totals):
+            if observed:
+                expected = row_total * column_total / total
+                statistic += 2 * observed * math.log(observed / expected)
+    return statistic, chi_square_survival(statistic, degrees_of_freedom)
+
+
+def compare(report, baseline, significance=0.01):
+    """Compare a report with a baseline report, problem by problem
+
+    Returns the names of problems whose answers shifted significantly
+    The speed up is None if the baseline has no speed to compare with
+    """
+    shifted = []
+    for name, result in report["problems"].items():
+        if name not in baseline["problems"]:
+            continue
+        base = baseline["problems"][name]
+        statistic, chance = g_test(result["answers"], base["answers"])
+        base_speed = base.get("codelets_per_second")
+        speed = result["codelets_per_second"] / base_speed if base_speed else None
+        result["baseline"] = {
+            "g": statistic,
+            "p": chance,
+            "speed_up": speed,
+            "shifted": chance < significance,
+        }
+        if chance < significance:
+            shifted += [name]
+    return shifted
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(prog="copycat.bench", description=__doc__)
+    parser.add_argument("--trials", type=int, default=20, help="trials per problem")
+    parser.add_argument("--seed", type=int, default=0, help="seed for all trials")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", help="compare with this earlier JSON report")
+    parser.add_argument(
+        "--significance", type=float, default=0.01, help="p-value to flag shifts"
+    )
+    parser.add_argument(
+        "problems",
+        nargs="*",
+        help="problems like abc:abd::ijk, or all the classic problems if none",
+    )
+    return parser.parse_args(args)
+
+
+def __parse_problem(name):
+    initial, modified, target = name.replace("::", ":").split(":")
+    return initial, modified, target
+
+
+def main():
+    args = parse_args(sys.argv[1:])
+    problems = [__parse_problem(_) for _ in args.problems] or PROBLEMS
+    report = bench(problems, args.trials, args.seed)
+    shifted = []
+    if args.compare:
+        with open(args.compare) as stream:
+            shifted = compare(report, json.load(stream), args.significance)
+    for name, result in report["problems"].items():
+        line = (
+            f"{name}: {result['time_per_trial']:.2f}s per trial, "
+            f"{result['codelets_per_second']:.0f} codelets/s, "
+            f"peak {result['peak_memory'] // 1024}KiB, "
+            f"{result['collections_per_trial']:.0f} collections/trial, "
+            f"{result['answers']}"
+        )
+        if "baseline" in result:
+            speed = result["baseline"]["speed_up"]
+            line += f", x{speed:.2f} speed" if speed is not None else ", speed n/a"
+            line += f", p={result['baseline']['p']:.3g}"
+        print(line)
+    for name in shifted:
+        print(f"Answers shifted for {name}", file=sys.stderr)
+    if args.output:
+        with open(args.output, "w") as stream:
+            json.dump(report, stream, indent=2)
+    return 1 if shifted else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,23 @@
-from .slipnet import slipnet
-from .workspace import workspace
+from .engine import slipnet
+from .engine import workspace
 from .workspace_structure import WorkspaceStructure
 
 
 class Bond(WorkspaceStructure):
+    __slots__ = (
+        "source",
+        "destination",
+        "left_object",
+        "right_object",
+        "direction_category",
+        "facet",
+        "source_descriptor",
+        "destination_descriptor",
+        "category",
+        "destination_is_on_right",
+        "bidirectional",
+    )
+
     def __init__(
         self,
         source,
@@ -54,8 +68,8 @@ class Bond(WorkspaceStructure):
         )
 
     def build_bond(self):
-        workspace.structures += [self]
-        self.string.bonds += [self]
+        workspace.add_structure(self)
+        self.string.add_bond(self)
         self.category.buffer = 100.0
         if self.direction_category:
             self.direction_category.buffer = 100.0
@@ -63,17 +77,18 @@ class Bond(WorkspaceStructure):
         self.right_object.left_bond = self
         self.left_object.bonds += [self]
         self.right_object.bonds += [self]
+        workspace.recount(self.left_object, self.right_object)
 
     def break_the_structure(self):
         self.break_bond()
 
     def break_bond(self):
-        if self in workspace.structures:
-            workspace.structures.remove(self)
+        workspace.remove_structure(self)
         if self in self.string.bonds:
-            self.string.bonds.remove(self)
+            self.string.remove_bond(self)
         self.left_object.right_bond = None
         self.right_object.left_bond = None
+        workspace.recount(self.left_object, self.right_object)
         if self in self.left_object.bonds:
             self.left_object.bonds.remove(self)
         if self in self.right_object.bonds:
@@ -109,6 +124,12 @@ class Bond(WorkspaceStructure):
                     incompatibles += [correspondence]
         return incompatibles
 
+    def strength_inputs(self):
+        return (
+            self.category.bond_degree_of_association(),
+            self.string.structures_version,
+        )
+
     def update_internal_strength(self):
         # bonds between objects of same type(ie. letter or group) are
         # stronger than bonds between different types
@@ -146,12 +167,9 @@ class Bond(WorkspaceStructure):
         return len(
             [
                 _
-                for _ in self.string.bonds
-                if _.string == self.source.string
-                and self.left_object.letter_distance(_.left_object) != 0
+                for _ in self.string.bonds_like(self)
+                if self.left_object.letter_distance(_.left_object) != 0
                 and self.right_object.letter_distance(_.right_object) != 0
-                and self.category == _.category
-                and self.direction_category == _.direction_category
             ]
         )
 
@@ -170,23 +188,23 @@ class Bond(WorkspaceStructure):
         # returns a rough measure of the density in the string
         # of the same bond-category and the direction-category of
         # the given bond
-        slot_sum = support_sum = 0.0
-        for object1 in workspace.objects:
-            if object1.string == self.string:
-                for object2 in workspace.objects:
-                    if object1.beside(object2):
-                        slot_sum += 1.0
-                        for bond in self.string.bonds:
-                            if (
-                                bond != self
-                                and self.same_categories(bond)
-                                and self.my_ends(object1, object2)
-                            ):
-                                support_sum += 1.0
-        try:
-            return 100.0 * support_sum / slot_sum
-        except ZeroDivisionError:
+        #
+        # Each pair of neighbouring objects is a slot, and the support
+        #   is the number of other bonds like this one, counted for each
+        #   slot which is held by this bond's own ends
+        # Both are counted from indexes kept by the string,
+        #   rather than by checking every slot against every bond
+        slots = self.string.adjacent_pairs
+        if not slots:
+            return 0.0
+        ends = self.source, self.destination
+        if not all(self.string.holds(_) for _ in ends):
+            return 0.0
+        if not self.source.beside(self.destination):
             return 0.0
+        bonds = self.string.bonds_like(self)
+        support = len(bonds) - (self in bonds)
+        return 100.0 * support / slots
 
     def same_neighbours(self, other):
         if self.left_object == other.left_object:
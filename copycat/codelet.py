@@ -1,10 +1,22 @@
 class Codelet:
+    __slots__ = (
+        "name",
+        "urgency",
+        "arguments",
+        "pressure",
+        "timestamp",
+        "index",
+        "method",
+    )
+
     def __init__(self, name: str, urgency, timestamp):
         self.name = name
         self.urgency = urgency
         self.arguments: list = []
         self.pressure = None
         self.timestamp = timestamp
+        self.index = None
+        self.method = None
 
     def __str__(self) -> str:
         return str(self.name)
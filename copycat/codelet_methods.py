@@ -1,21 +1,20 @@
-import logging
-import random
-
 from . import formulas
-from . import temperature
+from . import tracing
 from .bond import Bond
 from .bond import possible_group_bonds
-from .coderack import coderack
 from .correspondence import Correspondence
+from .engine import coderack
+from .engine import random
+from .engine import slipnet
+from .engine import temperature
+from .engine import workspace
 from .group import Group
 from .letter import Letter
 from .replacement import Replacement
-from .slipnet import slipnet
 from .workspace_formulas import choose_bond_facet
 from .workspace_formulas import choose_directed_neighbor
 from .workspace_formulas import choose_neighbour
 from .workspace_formulas import choose_unmodified_object
-from .workspace_formulas import workspace
 from .workspace_object import WorkspaceObject
 
 
@@ -35,13 +34,15 @@ def __get_scout_source(slipnode, relevance_method, type_name):
     target_relevance = relevance_method(workspace.target, slipnode)
     initial_unhappiness = workspace.initial.intra_string_unhappiness
     target_unhappiness = workspace.target.intra_string_unhappiness
-    logging.info(
-        f"initial : relevance = {initial_relevance}, "
-        f"unhappiness = {int(initial_unhappiness)}"
+    tracing.codelets(
+        "initial : relevance = %s, unhappiness = %d",
+        initial_relevance,
+        initial_unhappiness,
     )
-    logging.info(
-        f"target : relevance = {target_relevance}, "
-        f"unhappiness = {int(target_unhappiness)}"
+    tracing.codelets(
+        "target : relevance = %s, unhappiness = %d",
+        target_relevance,
+        target_unhappiness,
     )
     string = workspace.initial
     relevances = initial_relevance + target_relevance
@@ -50,9 +51,13 @@ def __get_scout_source(slipnode, relevance_method, type_name):
     initials = initial_relevance + initial_unhappiness
     if randomized > initials:
         string = workspace.target
-        logging.info(f"target string selected: {workspace.target} for {type_name}")
+        tracing.codelets(
+            "target string selected: %s for %s", workspace.target, type_name
+        )
     else:
-        logging.info(f"initial string selected: {workspace.initial} for {type_name}")
+        tracing.codelets(
+            "initial string selected: %s for %s", workspace.initial, type_name
+        )
     source = choose_unmodified_object("intra_string_salience", string.objects)
     return source
 
@@ -85,7 +90,7 @@ def __structure_versus_structure(structure1, weight1, structure2, weight2):
         structure2.total_strength * weight2
     )
     rhs = (weighted_strength1 + weighted_strength2) * random.random()
-    logging.info(f"{weighted_strength1} > {rhs}: {weighted_strength1 > rhs}")
+    tracing.codelets("%s > %s: %s", weighted_strength1, rhs, weighted_strength1 > rhs)
     return weighted_strength1 > rhs
 
 
@@ -96,9 +101,9 @@ def __fight(structure, structure_weight, incompatibles, incompatible_weight):
         if not __structure_versus_structure(
             structure, structure_weight, incompatible, incompatible_weight
         ):
-            logging.info(f"lost fight with {incompatible}")
+            tracing.codelets("lost fight with %s", incompatible)
             return False
-        logging.info(f"won fight with {incompatible}")
+        tracing.codelets("won fight with %s", incompatible)
     return True
 
 
@@ -107,11 +112,11 @@ def __fight_incompatibles(
 ):
     if len(incompatibles):
         if __fight(structure, structure_weight, incompatibles, incompatible_weight):
-            logging.info(f"broke the {name}")
+            tracing.codelets("broke the %s", name)
             return True
-        logging.info(f"failed to break {name}: Fizzle")
+        tracing.codelets("failed to break %s: Fizzle", name)
         return False
-    logging.info(f"no incompatible {name}")
+    tracing.codelets("no incompatible %s", name)
     return True
 
 
@@ -126,14 +131,11 @@ def __slippability(concept_mappings):
 
 # start the actual codelets
 def breaker():
-    probability_of_fizzle = (100.0 - formulas.Temperature) / 100.0
+    probability_of_fizzle = (100.0 - temperature.value) / 100.0
     assert not formulas.coin_flip(probability_of_fizzle)
     # choose a structure at random
-    structures = [
-        _ for _ in workspace.structures if isinstance(_, (Group, Bond, Correspondence))
-    ]
-    assert structures
-    structure = random.choice(structures)
+    structure = workspace.choose_structure(Group, Bond, Correspondence)
+    assert structure
     __show_which_string_object_is_from(structure)
     break_objects = [structure]
     if isinstance(structure, Bond):
@@ -211,19 +213,19 @@ def bottom_up_bond_scout(codelet):
     __show_which_string_object_is_from(source)
     destination = choose_neighbour(source)
     assert destination
-    logging.info(f"destination: {destination}")
+    tracing.codelets("destination: %s", destination)
     bond_facet = __get_bond_facet(source, destination)
-    logging.info(f"chosen bond facet: {bond_facet.get_name()}")
-    logging.info(f"Source: {source}, destination: {destination}")
+    tracing.codelets("chosen bond facet: %s", bond_facet)
+    tracing.codelets("Source: %s, destination: %s", source, destination)
     bond_descriptors = __get_descriptors(bond_facet, source, destination)
     source_descriptor, destination_descriptor = bond_descriptors
-    logging.info(f"source descriptor: {source_descriptor.name.upper()}")
-    logging.info(f"destination descriptor: {destination_descriptor.name.upper()}")
+    tracing.codelets("source descriptor: %s", source_descriptor)
+    tracing.codelets("destination descriptor: %s", destination_descriptor)
     category = source_descriptor.get_bond_category(destination_descriptor)
     assert category
     if category == slipnet.identity:
         category = slipnet.sameness
-    logging.info(f"proposing {category.name} bond ")
+    tracing.codelets("proposing %s bond ", category)
     coderack.propose_bond(
         source,
         destination,
@@ -276,7 +278,7 @@ def rule_scout(codelet):
     value_list = []
     for node in object_list:
         depth = node.conceptual_depth
-        value = formulas.temperature_adjusted_value(depth)
+        value = formulas.temperature_adjusted_depth(depth)
         value_list += [value]
     index = formulas.select_list_position(value_list)
     descriptor = object_list[index]
@@ -291,7 +293,7 @@ def rule_scout(codelet):
     value_list = []
     for node in object_list:
         depth = node.conceptual_depth
-        value = formulas.temperature_adjusted_value(depth)
+        value = formulas.temperature_adjusted_depth(depth)
         value_list += [value]
     index = formulas.select_list_position(value_list)
     relation = object_list[index]
@@ -312,10 +314,10 @@ def replacement_finder():
     # choose random letter in initial string
     letters = [_ for _ in workspace.initial.objects if isinstance(_, Letter)]
     letter_of_initial_string = random.choice(letters)
-    logging.info(f"selected letter in initial string = {letter_of_initial_string}")
+    tracing.codelets("selected letter in initial string = %s", letter_of_initial_string)
     if letter_of_initial_string.replacement:
-        logging.info(
-            f"Replacement already found for {letter_of_initial_string}, so fizzling"
+        tracing.codelets(
+            "Replacement already found for %s, so fizzling", letter_of_initial_string
         )
         return
     position = letter_of_initial_string.left_index
@@ -333,27 +335,28 @@ def replacement_finder():
     if abs(diff) < 2:
         relations = {0: slipnet.sameness, -1: slipnet.successor, 1: slipnet.predecessor}
         relation = relations[diff]
-        logging.info(f"Relation found: {relation.name}")
+        tracing.codelets("Relation found: %s", relation)
     else:
         relation = None
-        logging.info("no relation found")
+        tracing.codelets("no relation found")
     letter_of_initial_string.replacement = Replacement(
         letter_of_initial_string, letter_of_modified_string, relation
     )
+    workspace.recount(letter_of_initial_string)
     if relation != slipnet.sameness:
         letter_of_initial_string.changed = True
         workspace.changed_object = letter_of_initial_string
-    logging.info("building replacement")
+    tracing.codelets("building replacement")
 
 
 def top_down_bond_scout__category(codelet):
-    logging.info("top_down_bond_scout__category")
+    tracing.codelets("top_down_bond_scout__category")
     category = codelet.arguments[0]
     source = __get_scout_source(
         category, formulas.local_bond_category_relevance, "bond"
     )
     destination = choose_neighbour(source)
-    logging.info(f"source: {source}, destination: {destination}")
+    tracing.codelets("source: %s, destination: %s", source, destination)
     assert destination
     bond_facet = __get_bond_facet(source, destination)
     source_descriptor, destination_descriptor = __get_descriptors(
@@ -395,7 +398,7 @@ def top_down_bond_scout__direction(codelet):
     )
     destination = choose_directed_neighbor(source, direction)
     assert destination
-    logging.info(f"to object: {destination}")
+    tracing.codelets("to object: %s", destination)
     bond_facet = __get_bond_facet(source, destination)
     source_descriptor, destination_descriptor = __get_descriptors(
         bond_facet, source, destination
@@ -421,12 +424,12 @@ def bond_strength_tester(codelet):
     bond.update_strength()
     strength = bond.total_strength
     probability = formulas.temperature_adjusted_probability(strength / 100.0)
-    logging.info(f"bond strength = {strength} for {bond}")
+    tracing.codelets("bond strength = %s for %s", strength, bond)
     assert formulas.coin_flip(probability)
     bond.facet.buffer = 100.0
     bond.source_descriptor.buffer = 100.0
     bond.destination_descriptor.buffer = 100.0
-    logging.info("succeeded: posting bond-builder")
+    tracing.codelets("succeeded: posting bond-builder")
     coderack.new_codelet("bond-builder", codelet, strength)
 
 
@@ -440,12 +443,12 @@ def bond_builder(codelet):
             if bond.direction_category:
                 bond.direction_category.buffer = 100.0
             bond.category.buffer = 100.0
-            logging.info("already exists: activate descriptors & Fizzle")
+            tracing.codelets("already exists: activate descriptors & Fizzle")
             return
     incompatible_bonds = bond.get_incompatible_bonds()
-    logging.info(f"number of incompatible_bonds: {len(incompatible_bonds)}")
+    tracing.codelets("number of incompatible_bonds: %s", len(incompatible_bonds))
     if len(incompatible_bonds):
-        logging.info(str(incompatible_bonds[0]))
+        tracing.codelets("%s", incompatible_bonds[0])
     assert __fight_incompatibles(incompatible_bonds, bond, "bonds", 1.0, 1.0)
     incompatible_groups = bond.source.get_common_groups(bond.destination)
     assert __fight_incompatibles(incompatible_groups, bond, "groups", 1.0, 1.0)
@@ -455,7 +458,7 @@ def bond_builder(codelet):
         if bond.direction_category:
             incompatible_correspondences = bond.get_incompatible_correspondences()
             if incompatible_correspondences:
-                logging.info("trying to break incompatible correspondences")
+                tracing.codelets("trying to break incompatible correspondences")
                 assert __fight(bond, 2.0, incompatible_correspondences, 3.0)
     for incompatible in incompatible_bonds:
         incompatible.break_the_structure()
@@ -463,7 +466,7 @@ def bond_builder(codelet):
         incompatible.break_the_structure()
     for incompatible in incompatible_correspondences:
         incompatible.break_the_structure()
-    logging.info(f"building bond {bond}")
+    tracing.codelets("building bond %s", bond)
     bond.build_bond()
 
 
@@ -563,7 +566,7 @@ def top_down_group_scout__direction(codelet):
     source = __get_scout_source(
         direction, formulas.local_direction_category_relevance, "direction"
     )
-    logging.info(f"source chosen = {source}")
+    tracing.codelets("source chosen = %s", source)
     assert not source.spans_string()
     if source.leftmost:
         mydirection = slipnet.right
@@ -581,9 +584,9 @@ def top_down_group_scout__direction(codelet):
     else:
         first_bond = source.right_bond
     if not first_bond:
-        logging.info("no first_bond")
+        tracing.codelets("no first_bond")
     else:
-        logging.info(f"first_bond: {first_bond}")
+        tracing.codelets("first_bond: %s", first_bond)
     if first_bond and not first_bond.direction_category:
         direction = None
     if not first_bond or first_bond.direction_category != direction:
@@ -592,18 +595,18 @@ def top_down_group_scout__direction(codelet):
         else:
             first_bond = source.right_bond
         if not first_bond:
-            logging.info("no first_bond2")
+            tracing.codelets("no first_bond2")
         else:
-            logging.info(f"first_bond2: {first_bond}")
+            tracing.codelets("first_bond2: %s", first_bond)
         if first_bond and not first_bond.direction_category:
             direction = None
         assert first_bond
         assert first_bond.direction_category == direction
-    logging.info(f"possible group: {first_bond}")
+    tracing.codelets("possible group: %s", first_bond)
     category = first_bond.category
     assert category
     group_category = category.get_related_node(slipnet.group_category)
-    logging.info(f"trying from {source} to {category.name}")
+    tracing.codelets("trying from %s to %s", source, category)
     bond_facet = None
     # find leftmost object in group with these bonds
     search = True
@@ -638,7 +641,7 @@ def top_down_group_scout__direction(codelet):
             destination = destination.right_bond.right_object
             search = True
     assert destination != source
-    logging.info(f"proposing group from {source} to {destination}")
+    tracing.codelets("proposing group from %s to %s", source, destination)
     objects = [source]
     bonds = []
     while source != destination:
@@ -655,9 +658,9 @@ def group_scout__whole_string(codelet):
     string = workspace.initial
     if random.random() > 0.5:
         string = workspace.target
-        logging.info(f"target string selected: {workspace.target}")
+        tracing.codelets("target string selected: %s", workspace.target)
     else:
-        logging.info(f"initial string selected: {workspace.initial}")
+        tracing.codelets("initial string selected: %s", workspace.initial)
     # find leftmost object & the highest group to which it belongs
     leftmost = None
     for object_ in string.objects:
@@ -718,7 +721,7 @@ def group_builder(codelet):
     __show_which_string_object_is_from(group)
     equivalent = group.string.equivalent_group(group)
     if equivalent:
-        logging.info("already exists...activate descriptors & fizzle")
+        tracing.codelets("already exists...activate descriptors & fizzle")
         group.activate_descriptions()
         equivalent.add_descriptions(group.descriptions)
         return
@@ -785,7 +788,7 @@ def group_builder(codelet):
         incompatible.break_the_structure()
     group.build_group()
     group.activate_descriptions()
-    logging.info("building group")
+    tracing.codelets("building group")
 
 
 def rule_builder(codelet):
@@ -832,13 +835,13 @@ def rule_translator():
         if bond_density > 1.0:
             bond_density = 1.0
     cutoff = __get_cut_off(bond_density) * 10.0
-    assert cutoff >= formulas.actual_temperature
+    assert cutoff >= temperature.actual
     if workspace.rule.build_translated_rule():
         workspace.found_answer = True
     else:
         temperature.clamp_time = coderack.codelets_run + 100
         temperature.clamped = True
-        formulas.Temperature = 100.0
+        temperature.update(100.0)
 
 
 def bottom_up_correspondence_scout(codelet):
@@ -1008,7 +1011,7 @@ def correspondence_builder(codelet):
             if mapping.label:
                 mapping.label.buffer = 100.0
             if not mapping.is_contained_by(existing.concept_mappings):
-                existing.concept_mappings += [mapping]
+                existing.add_concept_mapping(mapping)
         return
     incompatibles = correspondence.get_incompatible_correspondences()
     # fight against all correspondences
@@ -1,33 +1,52 @@
 import inspect
-import logging
 import math
-import random
 import re
 
 from . import formulas
+from . import tracing
 from . import workspace_formulas
+from .bond import Bond
 from .codelet import Codelet
 from .coderack_pressure import CoderackPressures
-from .slipnet import slipnet
+from .correspondence import Correspondence
+from .description import Description
+from .engine import random
+from .engine import slipnet
+from .engine import temperature
+from .engine import workspace
+from .group import Group
+from .rule import Rule
+from .sum_tree import SumTree
+from .urgencies import BinnedUrgencies
+from .urgencies import TreeUrgencies
 
 NUMBER_OF_BINS = 7
 MAX_NUMBER_OF_CODELETS = 100
 
 
+def _ignoring_codelet(method):
+    """Wrap a codelet method which takes no arguments to take the codelet"""
+
+    def run(_codelet):
+        return method()
+
+    return run
+
+
 def get_urgency_bin(urgency):
-    index = int(urgency) * NUMBER_OF_BINS / 100
+    index = int(urgency) * NUMBER_OF_BINS // 100
     if index >= NUMBER_OF_BINS:
         return NUMBER_OF_BINS
     return index + 1
 
 
 class CodeRack:
-    def __init__(self):
+    def __init__(self, bin_urgencies=False):
         self.speed_up_bonds = False
         self.remove_breaker_codelets = False
         self.remove_terraced_scan = False
+        self.bin_urgencies = bin_urgencies
         self.pressures = CoderackPressures()
-        self.pressures.initialise_pressures()
         self.reset()
         self.initial_codelet_names = (
             "bottom-up-bond-scout",
@@ -39,10 +58,14 @@ class CodeRack:
         self.postings = {}
 
     def reset(self):
-        from .temperature import temperature
-
         self.codelets = []
         self.codelets_run = 0
+        if self.bin_urgencies:
+            self.urgencies = BinnedUrgencies()
+        else:
+            self.urgencies = TreeUrgencies(self.codelets, MAX_NUMBER_OF_CODELETS + 1)
+        self.ages = SumTree(MAX_NUMBER_OF_CODELETS + 1)
+        self.births = SumTree(MAX_NUMBER_OF_CODELETS + 1)
         temperature.clamped = True
         self.pressures.reset()
 
@@ -52,19 +75,24 @@ class CodeRack:
             self.post_bottom_up_codelets()
 
     def post(self, codelet):
+        if not codelet.method:
+            codelet.method = self.get_codelet_method(codelet.name)
         self.postings[codelet.name] = self.postings.get(codelet.name, 0) + 1
         self.pressures.add_codelet(codelet)
+        codelet.index = len(self.codelets)
         self.codelets += [codelet]
-        if len(self.codelets) > 100:
+        self.urgencies.add(codelet)
+        self.__set_ages(codelet.index, codelet)
+        if len(self.codelets) > MAX_NUMBER_OF_CODELETS:
             old_codelet = self.choose_old_codelet()
             self.remove_codelet(old_codelet)
 
     def post_top_down_codelets(self):
         for node in slipnet.slipnodes:
-            logging.info(f"Trying slipnode: {node}")
+            tracing.codelets("Trying slipnode: %s", node)
             if node.activation != 100.0:
                 continue
-            logging.info(f"Using slipnode: {node}")
+            tracing.codelets("Using slipnode: %s", node)
             for codelet_name in node.codelets:
                 probability = workspace_formulas.probability_of_posting(codelet_name)
                 how_many = workspace_formulas.how_many_to_post(codelet_name)
@@ -76,11 +104,13 @@ class CodeRack:
                     )
                     codelet = Codelet(codelet_name, urgency, self.codelets_run)
                     codelet.arguments += [node]
-                    logging.info(f"Post top down: {codelet}, with urgency: {urgency}")
+                    tracing.codelets(
+                        "Post top down: %s, with urgency: %s", codelet, urgency
+                    )
                     self.post(codelet)
 
     def post_bottom_up_codelets(self):
-        logging.info("posting bottom up codelets")
+        tracing.codelets("posting bottom up codelets")
         self.__post_bottom_up_codelets("bottom-up-description-scout")
         self.__post_bottom_up_codelets("bottom-up-bond-scout")
         self.__post_bottom_up_codelets("group-scout--whole-string")
@@ -101,7 +131,7 @@ class CodeRack:
         urgency = 3
         if codelet_name == "breaker":
             urgency = 1
-        if formulas.Temperature < 25.0 and "translator" in codelet_name:
+        if temperature.value < 25.0 and "translator" in codelet_name:
             urgency = 5
         for _ in range(0, how_many):
             if random.random() < probability:
@@ -109,11 +139,33 @@ class CodeRack:
                 self.post(codelet)
 
     def remove_codelet(self, codelet):
-        self.codelets.remove(codelet)
+        self.urgencies.remove(codelet)
+        last = self.codelets.pop()
+        if last is not codelet:
+            self.urgencies.remove(last)
+            self.codelets[codelet.index] = last
+            last.index = codelet.index
+            self.urgencies.add(last)
+            self.__set_ages(last.index, last)
+        self.__set_ages(len(self.codelets), None)
+        codelet.index = None
         self.pressures.remove_codelet(codelet)
 
+    def __set_ages(self, index, codelet):
+        """Keep the weights for removal of the codelet at that index
+
+        Weights of removed codelets are zero, so they are never chosen
+        """
+        if not codelet:
+            self.ages[index] = self.births[index] = 0.0
+            return
+        # the weight for removal, (codelets_run - timestamp) * (7.5 - urgency),
+        #   is kept as its two terms, so that it can grow with codelets_run
+        self.ages[index] = 7.5 - codelet.urgency
+        self.births[index] = codelet.timestamp * (7.5 - codelet.urgency)
+
     def new_codelet(self, name, old_codelet, strength, arguments=None):
-        logging.debug(f"Posting new codelet called {name}")
+        tracing.codelets("Posting new codelet called %s", name)
         urgency = get_urgency_bin(strength)
         new_codelet = Codelet(name, urgency, self.codelets_run)
         if arguments:
@@ -129,8 +181,6 @@ class CodeRack:
         The new codelet has urgency a function of
             the degree of conceptual-depth of the descriptions in the rule
         """
-        from .rule import Rule
-
         rule = Rule(facet, description, category, relation)
         rule.update_strength()
         if description and relation:
@@ -149,8 +199,6 @@ class CodeRack:
         flip_target_object,
         old_codelet,
     ):
-        from .correspondence import Correspondence
-
         correspondence = Correspondence(
             initial_object, target_object, concept_mappings, flip_target_object
         )
@@ -165,14 +213,14 @@ class CodeRack:
         if urgency:
             urgency /= number_of_mappings
         binn = get_urgency_bin(urgency)
-        logging.info(f"urgency: {urgency}, number: {number_of_mappings}, bin: {binn}")
+        tracing.codelets(
+            "urgency: %s, number: %s, bin: %s", urgency, number_of_mappings, binn
+        )
         self.new_codelet(
             "correspondence-strength-tester", old_codelet, urgency, correspondence
         )
 
     def propose_description(self, object_, type_, descriptor, old_codelet):
-        from .description import Description
-
         description = Description(object_, type_, descriptor)
         descriptor.buffer = 100.0
         urgency = type_.activation
@@ -194,8 +242,6 @@ class CodeRack:
         bond_facet,
         old_codelet,
     ):
-        from .group import Group
-
         bond_category = group_category.get_related_node(slipnet.bond_category)
         bond_category.buffer = 100.0
         if direction_category:
@@ -221,8 +267,6 @@ class CodeRack:
         destination_descriptor,
         old_codelet,
     ):
-        from .bond import Bond
-
         bond_facet.buffer = 100.0
         source_descriptor.buffer = 100.0
         destination_descriptor.buffer = 100.0
@@ -242,18 +286,12 @@ class CodeRack:
         # more likely to select lower urgency codelets
         if not len(self.codelets):
             return None
-        urgencies = []
-        for codelet in self.codelets:
-            urgency = (coderack.codelets_run - codelet.timestamp) * (
-                7.5 - codelet.urgency
-            )
-            urgencies += [urgency]
-        threshold = random.random() * sum(urgencies)
-        sum_of_urgencies = 0.0
-        for index in range(0, len(self.codelets)):
-            sum_of_urgencies += urgencies[index]
-            if sum_of_urgencies > threshold:
-                return self.codelets[index]
+        now = self.codelets_run
+        urgencies = now * self.ages.total() - self.births.total()
+        threshold = random.random() * urgencies
+        index = self.ages.find(threshold, now, self.births)
+        if index < len(self.codelets):
+            return self.codelets[index]
         return self.codelets[0]
 
     def post_initial_codelets(self):
@@ -271,6 +309,10 @@ class CodeRack:
             self.post(new_codelet)
 
     def get_codeletmethods(self):
+        """Map the name of each codelet to the method which runs it
+
+        Every method in the map takes the codelet as its only argument
+        """
         from . import codelet_methods
 
         self.codelet_methods_dir = dir(codelet_methods)
@@ -308,11 +350,20 @@ class CodeRack:
                     f"Cannot find {method_name} in codelet_methods"
                 )
             method = getattr(codelet_methods, method_name)
-            self.methods[method_name] = method
+            if not callable(method):
+                raise RuntimeError(f"Cannot call {method_name}()")
+            if "codelet" not in inspect.signature(method).parameters:
+                method = _ignoring_codelet(method)
+            self.methods[codelet_name] = method
+
+    def get_codelet_method(self, codelet_name):
+        if not self.codelet_methods_dir:
+            self.get_codeletmethods()
+        return self.methods[codelet_name]
 
     def choose_and_run_codelet(self):
-        if not len(coderack.codelets):
-            coderack.post_initial_codelets()
+        if not len(self.codelets):
+            self.post_initial_codelets()
         codelet = self.choose_codelet_to_run()
         if codelet:
             self.run(codelet)
@@ -320,63 +371,25 @@ class CodeRack:
     def choose_codelet_to_run(self):
         if not self.codelets:
             return None
-        temp = formulas.Temperature
+        temp = temperature.value
         scale = (100.0 - temp + 10.0) / 15.0
-        urgsum = 0.0
-        for codelet in self.codelets:
-            urg = codelet.urgency**scale
-            urgsum += urg
-        threshold = urgsum * random.random()
-        chosen = None
-        urgency_sum = 0.0
+        chosen = self.urgencies.choose(scale)
         formulas.log_temperature()
         formulas.log_actual_temperature()
-        logging.info("Slipnet:")
-        for node in slipnet.slipnodes:
-            logging.info(
-                f"\tnode {node.get_name()}, activation: {node.activation}, "
-                f"buffer: {node.buffer}, depth: {node.conceptual_depth}"
-            )
-        logging.info("Coderack:")
-        for codelet in self.codelets:
-            logging.info(f"\t{codelet.name}, {codelet.urgency}")
-        from .workspace import workspace
-
-        workspace.initial.log("Initial: ")
-        workspace.target.log("Target: ")
-        for codelet in self.codelets:
-            urgency_sum += codelet.urgency**scale
-            if not chosen and urgency_sum > threshold:
-                chosen = codelet
-                break
-        if not chosen:
-            chosen = self.codelets[0]
+        tracing.slipnet(slipnet)
+        tracing.coderack(self.codelets)
+        tracing.workspace(workspace)
         self.remove_codelet(chosen)
-        logging.info(f"chosen codelet:\n\t{chosen.name}, urgency = {chosen.urgency}")
+        tracing.codelets(
+            "chosen codelet:\n\t%s, urgency = %s", chosen.name, chosen.urgency
+        )
         return chosen
 
     def run(self, codelet):
-        method_name = re.sub("[ -]", "_", codelet.name)
         self.codelets_run += 1
-        self.run_codelets[method_name] = self.run_codelets.get(method_name, 0) + 1
-
-        if not self.codelet_methods_dir:
-            self.get_codeletmethods()
-        method = self.methods[method_name]
-        if not method:
-            raise ValueError(
-                f"Found {method_name} in codelet_methods, but cannot get it"
-            )
-        if not callable(method):
-            raise RuntimeError(f"Cannot call {method_name}()")
-        args, _varargs, _varkw, _defaults = inspect.getargspec(method)
+        self.run_codelets[codelet.name] = self.run_codelets.get(codelet.name, 0) + 1
+        method = codelet.method or self.get_codelet_method(codelet.name)
         try:
-            if "codelet" in args:
-                method(codelet)
-            else:
-                method()
+            method(codelet)
         except AssertionError:
             pass
-
-
-coderack = CodeRack()
@@ -1,7 +1,11 @@
-import logging
+import collections
 
-from .formulas import Temperature
-from .slipnet import slipnet
+from . import tracing
+from .engine import slipnet
+from .engine import temperature
+
+# How many of the latest values each pressure remembers
+HISTORY_LENGTH = 1000
 
 
 class CoderackPressure:
@@ -9,13 +13,26 @@ class CoderackPressure:
         self.name = name
 
     def reset(self):
-        self.unmodifed_values = []
-        self.values = []
-        self.codelets = []
+        self.values = collections.deque(maxlen=HISTORY_LENGTH)
+        self.urgencies = collections.Counter()
+
+    def add(self, codelet):
+        self.urgencies[codelet.urgency] += 1
+
+    def remove(self, codelet):
+        self.urgencies[codelet.urgency] -= 1
+
+    def value(self, scale):
+        """Sum of urgency ** scale over the codelets in this pressure"""
+        return sum(count * urgency**scale for urgency, count in self.urgencies.items())
 
 
-def _codelet_index(codelet):
-    name_indices = {
+def _name_indices():
+    """Index of the pressure for each name of codelet
+
+    Top down codelets depend on the slipnode they were posted for
+    """
+    return {
         "bottom-up-bond-scout": 0,
         "top-down-bond-scout--category": {
             slipnet.successor: 1,
@@ -45,6 +62,9 @@ def _codelet_index(codelet):
         "important-object-correspondence-scout": 16,
         "breaker": 17,
     }
+
+
+def _codelet_index(name_indices, codelet):
     name_index = name_indices.get(codelet.name, -1)
     try:
         return int(name_index)
@@ -59,6 +79,7 @@ def _codelet_index(codelet):
 class CoderackPressures:
     def __init__(self):
         self.initialise_pressures()
+        self.name_indices = None
         self.reset()
 
     def initialise_pressures(self):
@@ -83,11 +104,8 @@ class CoderackPressures:
         self.pressures += [CoderackPressure("Breakers")]
 
     def calculate_pressures(self):
-        scale = (100.0 - Temperature + 10.0) / 15.0
-        values = []
-        for pressure in self.pressures:
-            value = sum(_.urgency**scale for _ in pressure.codelets)
-            values += [value]
+        scale = (100.0 - temperature.value + 10.0) / 15.0
+        values = [pressure.value(scale) for pressure in self.pressures]
         total_value = sum(values)
         if not total_value:
             total_value = 1.0
@@ -95,35 +113,29 @@ class CoderackPressures:
         self.max_value = max(values)
         for pressure, value in zip(self.pressures, values):
             pressure.values += [value * 100.0]
-        for codelet in self.removed_codelets:
-            if codelet.pressure:
-                codelet.pressure.codelets.remove_element(codelet)
-        self.removed_codelets = []
 
     def reset(self):
         self.max_value = 0.001
         for pressure in self.pressures:
             pressure.reset()
-        self.removed_codelets = []
 
     def add_codelet(self, codelet):
-        node = None
-        index = _codelet_index(codelet)
-        if index >= 0:
-            self.pressures[index].codelets += [codelet]
-        if codelet.pressure:
-            codelet.pressure.codelets += [codelet]
+        """Count the codelet in its pressure
+
+        A codelet with no pressure of its own keeps that of its parent
+        """
+        if self.name_indices is None:
+            self.name_indices = _name_indices()
+        index = _codelet_index(self.name_indices, codelet)
         if index >= 0:
             codelet.pressure = self.pressures[index]
-        logging.info(f"Add {codelet.name}: {index}")
-        if node:
-            logging.info(f"Node: {node.name}")
+        if codelet.pressure:
+            codelet.pressure.add(codelet)
+        tracing.codelets("Add %s: %d", codelet.name, index)
 
     def remove_codelet(self, codelet):
-        self.removed_codelets += [codelet]
+        if codelet.pressure:
+            codelet.pressure.remove(codelet)
 
     def number_of_pressures(self):
         return len(self.pressures)
-
-
-coderack_pressures = CoderackPressures()
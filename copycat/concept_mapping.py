@@ -1,12 +1,126 @@
 from __future__ import annotations
 
-import logging
 from typing import List
 
-from .slipnet import slipnet
+from . import tracing
+from .engine import slipnet
+
+
+class MappingKind:
+    """What a concept mapping maps, whichever objects it maps
+
+    The slipnet keeps one kind for each pair of description types and descriptors
+        (see SlipNet.mapping_kind()), so what follows from the slipnet's links
+        (the label, the link between the descriptors, and which kinds are
+        incompatible with or support which) is worked out once for each kind
+    """
+
+    __slots__ = (
+        "initial_description_type",
+        "target_description_type",
+        "initial_descriptor",
+        "target_descriptor",
+        "label",
+        "link",
+        "relations",
+    )
+
+    def __init__(
+        self,
+        initial_description_type,
+        target_description_type,
+        initial_descriptor,
+        target_descriptor,
+    ):
+        self.initial_description_type = initial_description_type
+        self.target_description_type = target_description_type
+        self.initial_descriptor = initial_descriptor
+        self.target_descriptor = target_descriptor
+        self.label = initial_descriptor.get_bond_category(target_descriptor)
+        self.link = initial_descriptor.slip_links_to.get(target_descriptor)
+        # whether this kind is incompatible with, and supports, each other kind
+        self.relations = {}
+
+    def degree_of_association(self):
+        # Assumes the 2 descriptors are connected in the slipnet by <= 1 link
+        if self.initial_descriptor == self.target_descriptor:
+            return 100.0
+        if self.link:
+            return self.link.degree_of_association()
+        return 0.0
+
+    def conceptual_depth(self):
+        return (
+            self.initial_descriptor.conceptual_depth
+            + self.target_descriptor.conceptual_depth
+        ) / 2.0
+
+    def related(self, other):
+        if self.initial_descriptor.related(other.initial_descriptor):
+            return True
+        return self.target_descriptor.related(other.target_descriptor)
+
+    def relation(self, other):
+        """Whether this kind is incompatible with the other, and supports it"""
+        relation = self.relations.get(other)
+        if relation is None:
+            relation = self.relations[other] = (
+                self.__incompatible(other),
+                self.__supports(other),
+            )
+        return relation
+
+    def __incompatible(self, other):
+        # Concept-mappings (a -> b) and (c -> d) are incompatible if a is
+        # related to c or if b is related to d, and the a -> b relationship is
+        # different from the c -> d relationship. E.g., rightmost -> leftmost
+        # is incompatible with right -> right, since rightmost is linked
+        # to right, but the relationships (opposite and identity) are different
+        # Notice that slipnet distances are not looked at, only slipnet links.
+        # This should be changed eventually.
+        if not self.related(other):
+            return False
+        if not self.label or not other.label:
+            return False
+        return self.label != other.label
+
+    def __supports(self, other):
+        # Concept-mappings (a -> b) and (c -> d) support each other if a is
+        # related to c and if b is related to d and the a -> b relationship is
+        # the same as the c -> d relationship.  E.g., rightmost -> rightmost
+        # supports right -> right and leftmost -> leftmost.
+        # Notice that slipnet distances are not looked at, only slipnet links.
+        # This should be changed eventually.
+
+        # If the two concept-mappings are the same, then return t.  This
+        # means that letter->group supports letter->group, even though these
+        # concept-mappings have no label.
+
+        if self.initial_descriptor == other.initial_descriptor:
+            if self.target_descriptor == other.target_descriptor:
+                return True
+        # if the descriptors are not related return false
+        if not self.related(other):
+            return False
+        if not self.label or not other.label:
+            return False
+        return self.label == other.label
 
 
 class ConceptMapping:
+    """A kind of mapping, between descriptions of an initial and a target object"""
+
+    __slots__ = (
+        "kind",
+        "initial_description_type",
+        "target_description_type",
+        "initial_descriptor",
+        "target_descriptor",
+        "initial_object",
+        "target_object",
+        "label",
+    )
+
     def __init__(
         self,
         initial_description_type,
@@ -16,9 +130,14 @@ class ConceptMapping:
         initial_object,
         target_object,
     ):
-        logging.info(
-            f"make a map: {initial_description_type.get_name()}-"
-            f"{target_description_type.get_name()}"
+        tracing.codelets(
+            "make a map: %s-%s", initial_description_type, target_description_type
+        )
+        self.kind = slipnet.mapping_kind(
+            initial_description_type,
+            target_description_type,
+            initial_descriptor,
+            target_descriptor,
         )
         self.initial_description_type = initial_description_type
         self.target_description_type = target_description_type
@@ -26,7 +145,7 @@ class ConceptMapping:
         self.target_descriptor = target_descriptor
         self.initial_object = initial_object
         self.target_object = target_object
-        self.label = initial_descriptor.get_bond_category(target_descriptor)
+        self.label = self.kind.label
 
     def __repr__(self):
         return (
@@ -38,34 +157,19 @@ class ConceptMapping:
         return self.label and self.label.name or "anonymous"
 
     def slippability(self):
-        association = self.__degree_of_association()
+        association = self.kind.degree_of_association()
         if association == 100.0:
             return 100.0
-        depth = self.__conceptual_depth() / 100.0
+        depth = self.kind.conceptual_depth() / 100.0
         return association * (1 - depth * depth)
 
-    def __degree_of_association(self):
-        # Assumes the 2 descriptors are connected in the slipnet by <= 1 link
-        if self.initial_descriptor == self.target_descriptor:
-            return 100.0
-        for link in self.initial_descriptor.lateral_slip_links:
-            if link.destination == self.target_descriptor:
-                return link.degree_of_association()
-        return 0.0
-
     def strength(self):
-        association = self.__degree_of_association()
+        association = self.kind.degree_of_association()
         if association == 100.0:
             return 100.0
-        depth = self.__conceptual_depth() / 100.0
+        depth = self.kind.conceptual_depth() / 100.0
         return association * (1 + depth * depth)
 
-    def __conceptual_depth(self):
-        return (
-            self.initial_descriptor.conceptual_depth
-            + self.target_descriptor.conceptual_depth
-        ) / 2.0
-
     def distinguishing(self):
         if self.initial_descriptor == slipnet.whole:
             if self.target_descriptor == slipnet.whole:
@@ -95,7 +199,7 @@ class ConceptMapping:
         return False
 
     def same_kind(self, mapping: ConceptMapping) -> bool:
-        return self.same_types(mapping) and self.same_descriptors(mapping)
+        return self.kind is mapping.kind
 
     def nearly_same_kind(self, mapping: ConceptMapping) -> bool:
         return self.same_types(mapping) and self.same_initial_descriptor(mapping)
@@ -107,45 +211,13 @@ class ConceptMapping:
         return any(self.nearly_same_kind(mapping) for mapping in mappings)
 
     def related(self, other):
-        if self.initial_descriptor.related(other.initial_descriptor):
-            return True
-        return self.target_descriptor.related(other.target_descriptor)
+        return self.kind.related(other.kind)
 
     def incompatible(self, other):
-        # Concept-mappings (a -> b) and (c -> d) are incompatible if a is
-        # related to c or if b is related to d, and the a -> b relationship is
-        # different from the c -> d relationship. E.g., rightmost -> leftmost
-        # is incompatible with right -> right, since rightmost is linked
-        # to right, but the relationships (opposite and identity) are different
-        # Notice that slipnet distances are not looked at, only slipnet links.
-        # This should be changed eventually.
-        if not self.related(other):
-            return False
-        if not self.label or not other.label:
-            return False
-        return self.label != other.label
+        return self.kind.relation(other.kind)[0]
 
     def supports(self, other):
-        # Concept-mappings (a -> b) and (c -> d) support each other if a is
-        # related to c and if b is related to d and the a -> b relationship is
-        # the same as the c -> d relationship.  E.g., rightmost -> rightmost
-        # supports right -> right and leftmost -> leftmost.
-        # Notice that slipnet distances are not looked at, only slipnet links.
-        # This should be changed eventually.
-
-        # If the two concept-mappings are the same, then return t.  This
-        # means that letter->group supports letter->group, even though these
-        # concept-mappings have no label.
-
-        if self.initial_descriptor == other.initial_descriptor:
-            if self.target_descriptor == other.target_descriptor:
-                return True
-        # if the descriptors are not related return false
-        if not self.related(other):
-            return False
-        if not self.label or not other.label:
-            return False
-        return self.label == other.label
+        return self.kind.relation(other.kind)[1]
 
     def relevant(self):
         if self.initial_description_type.fully_active():
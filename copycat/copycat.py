@@ -1,11 +1,17 @@
 import logging
+import math
+import random
+import statistics
+import time
 
-from .coderack import coderack
-from .coderack_pressure import coderack_pressures
-from .slipnet import slipnet
-from .temperature import temperature
-from .workspace import workspace
-from .workspace_formulas import workspace_formulas
+from . import engine
+from . import tracing
+from .engine import coderack
+from .engine import coderack_pressures
+from .engine import slipnet
+from .engine import temperature
+from .engine import workspace
+from .engine import workspace_formulas
 
 
 def update_everything():
@@ -25,15 +31,21 @@ def main_loop(last_update):
     elif coderack.codelets_run - last_update >= slipnet.time_step_ength:
         update_everything()
         result = coderack.codelets_run
-    logging.debug(f"Number of codelets: {len(coderack.codelets)}")
+    tracing.codelets("Number of codelets: %d", len(coderack.codelets))
     coderack.choose_and_run_codelet()
     return result
 
 
-def run_trial(answers):
-    """Run a trial of the copycat algorithm"""
+def run_trial(answers, seed=None):
+    """Run a trial of the copycat algorithm
+
+    If a seed is given then the engine's random numbers are seeded with it first
+    """
+    if seed is not None:
+        engine.random.seed(seed)
     slipnet.reset()
     workspace.reset()
+    temperature.reset()
     coderack.reset()
     last_update = 0
     while not workspace.found_answer:
@@ -45,7 +57,10 @@ def run_trial(answers):
     final_temperature = temperature.value
     final_time = coderack.codelets_run
     logging.info(
-        f"Answered {answer} (time {final_time}, final temperature {final_temperature})"
+        "Answered %s (time %s, final temperature %s)",
+        answer,
+        final_time,
+        final_temperature,
     )
     answers[answer] = answers.get(answer, {"count": 0, "tempsum": 0, "timesum": 0})
     answers[answer]["count"] += 1
@@ -53,12 +68,147 @@ def run_trial(answers):
     answers[answer]["timesum"] += final_time
 
 
-def run(initial, modified, target, iterations):
+def trial_seeds(iterations, seed=None):
+    """A seed for each trial, all drawn from the one seed
+
+    Without a seed they are drawn from the engine's random numbers
+    """
+    seeds = engine.random if seed is None else random.Random(seed)
+    return [seeds.getrandbits(64) for _ in range(iterations)]
+
+
+def run_seeded_trials(initial, modified, target, seeds):
+    """Run a trial for each seed, and total the answers"""
+    workspace.set_strings(initial, modified, target)
+    answers = {}
+    for seed in seeds:
+        run_trial(answers, seed)
+    return answers
+
+
+def run_trials(initial, modified, target, iterations, seed=None):
+    """Run some trials, and total the answers
+
+    Each trial is seeded from the seed, so runs with the same seed
+        give the same answers
+    """
+    seeds = trial_seeds(iterations, seed)
+    return run_seeded_trials(initial, modified, target, seeds)
+
+
+def __run_shard(shard):
+    """Run a share of the trials, in a worker process"""
+    return run_seeded_trials(*shard)
+
+
+def __shards(initial, modified, target, seeds, processes):
+    """Split the trials into shards, each with the seeds of its trials
+
+    There are a few shards per process, so that a process which
+        is given a shard of quick trials does not wait on the others
+    """
+    number_of_shards = min(len(seeds), processes * 4)
+    for index in range(number_of_shards):
+        yield initial, modified, target, seeds[index::number_of_shards]
+
+
+def __merge(answers, shard_answers):
+    """Add the totals from a shard of trials to the answers"""
+    for answer, totals in shard_answers.items():
+        if answer not in answers:
+            answers[answer] = totals
+            continue
+        for key, value in totals.items():
+            answers[answer][key] += value
+
+
+def run_in_parallel(initial, modified, target, iterations, processes=None, seed=None):
+    """Run the trials in a pool of processes, and total the answers
+
+    If processes is None then there is a process per CPU
+    Each trial is seeded as run_trials() would, so the answers do not
+        depend on how many processes there are
+    """
+    import multiprocessing
+
+    processes = processes or multiprocessing.cpu_count()
+    seeds = trial_seeds(iterations, seed)
+    shards = list(__shards(initial, modified, target, seeds, processes))
+    answers = {}
+    with multiprocessing.Pool(processes) as pool:
+        for shard_answers in pool.map(__run_shard, shards):
+            __merge(answers, shard_answers)
+    return answers
+
+
+def wilson_interval(successes, trials, confidence=0.95):
+    """The Wilson score interval of a chance, from successes in some trials"""
+    z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+    share = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (share + z * z / (2 * trials)) / denominator
+    spread = share * (1 - share) / trials + z * z / (4 * trials * trials)
+    spread = z * math.sqrt(spread) / denominator
+    return centre - spread, centre + spread
+
+
+def run_until_confident(
+    initial,
+    modified,
+    target,
+    iterations,
+    margin=0.05,
+    confidence=0.95,
+    seconds=None,
+    seed=None,
+):
+    """Run trials until the share of the leading answer is known well enough
+
+    Trials stop when the Wilson interval for the leading answer's share
+        is within the margin either side, at that confidence
+    Or, failing that, after that many iterations, or that many seconds
+    The answers are as from run(), each with the interval of its share too
+        and the sum of their counts is how many trials were run
+    Each trial is seeded as run() would, so the same seed gives the same answers
+        unless trials are stopped by time
+    """
     workspace.set_strings(initial, modified, target)
+    start = time.perf_counter()
     answers = {}
-    for _ in range(iterations):
-        run_trial(answers)
+    trials = 0
+    for trial_seed in trial_seeds(iterations, seed):
+        run_trial(answers, trial_seed)
+        trials += 1
+        leading = max(_["count"] for _ in answers.values())
+        low, high = wilson_interval(leading, trials, confidence)
+        if high - low <= 2 * margin:
+            break
+        if seconds is not None and time.perf_counter() - start >= seconds:
+            break
+    for value in answers.values():
+        value["interval"] = wilson_interval(value["count"], trials, confidence)
+    __average(answers)
+    return answers
+
+
+def __average(answers):
+    """Replace the totals of temperature and time by averages"""
     for value in answers.values():
         value["avgtemp"] = value.pop("tempsum") / value["count"]
         value["avgtime"] = value.pop("timesum") / value["count"]
+
+
+def run(initial, modified, target, iterations, processes=1, seed=None):
+    """Run the trials, and average the time and temperature for each answer
+
+    The trials are run in that many processes, or one per CPU if None
+    If a seed is given then the same seed gives the same answers
+    """
+    if processes == 1:
+        answers = run_trials(initial, modified, target, iterations, seed)
+    else:
+        answers = run_in_parallel(
+            initial, modified, target, iterations, processes, seed
+        )
+    __average(answers)
     return answers
@@ -1,9 +1,23 @@
+from .concept_mapping import ConceptMapping
+from .engine import slipnet
+from .engine import workspace
 from .formulas import get_mappings
-from .workspace import workspace
+from .group import Group
+from .letter import Letter
 from .workspace_structure import WorkspaceStructure
 
 
 class Correspondence(WorkspaceStructure):
+    __slots__ = (
+        "object_from_initial",
+        "object_from_target",
+        "concept_mappings",
+        "flip_target_object",
+        "accessory_concept_mappings",
+        "distinguishing_mappings",
+        "distinguishing_version",
+    )
+
     def __init__(
         self,
         object_from_initial,
@@ -17,6 +31,8 @@ class Correspondence(WorkspaceStructure):
         self.concept_mappings = concept_mappings
         self.flip_target_object = flip_target_object
         self.accessory_concept_mappings = []
+        self.distinguishing_mappings = []
+        self.distinguishing_version = None
 
     def __repr__(self):
         return f"<{self.__class__.__name__} {self}>"
@@ -27,11 +43,30 @@ class Correspondence(WorkspaceStructure):
             f"and {self.object_from_target}"
         )
 
+    def descriptions_version(self):
+        """Changes when descriptions change in the strings of either object"""
+        return (
+            self.object_from_initial.string.version,
+            self.object_from_target.string.version,
+        )
+
     def distinguishing_concept_mappings(self):
-        return [_ for _ in self.concept_mappings if _.distinguishing()]
+        """The distinguishing mappings, found again when descriptions change"""
+        version = self.descriptions_version()
+        if version != self.distinguishing_version:
+            self.distinguishing_mappings = [
+                _ for _ in self.concept_mappings if _.distinguishing()
+            ]
+            self.distinguishing_version = version
+        return self.distinguishing_mappings
 
     def relevant_distinguishing_concept_mappings(self):
-        return [_ for _ in self.concept_mappings if _.distinguishing() and _.relevant()]
+        return [_ for _ in self.distinguishing_concept_mappings() if _.relevant()]
+
+    def add_concept_mapping(self, mapping):
+        self.concept_mappings += [mapping]
+        self.distinguishing_version = None
+        workspace.supports.update(self)
 
     def extract_target_bond(self):
         target_bond = False
@@ -56,9 +91,6 @@ class Correspondence(WorkspaceStructure):
         target_bond = self.extract_target_bond()
         if not target_bond:
             return None
-        from .concept_mapping import ConceptMapping
-        from .slipnet import slipnet
-
         if initial_bond.direction_category and target_bond.direction_category:
             mapping = ConceptMapping(
                 slipnet.direction_category,
@@ -109,17 +141,13 @@ class Correspondence(WorkspaceStructure):
         return False
 
     def support(self):
-        from .letter import Letter
-
         if isinstance(self.object_from_initial, Letter):
             if self.object_from_initial.spans_string():
                 return 100.0
         if isinstance(self.object_from_target, Letter):
             if self.object_from_target.spans_string():
                 return 100.0
-        total = sum(
-            _.total_strength for _ in workspace.correspondences() if self.supporting(_)
-        )
+        total = sum(_.total_strength for _ in workspace.supports.supported(self))
         total = min(total, 100.0)
         return total
 
@@ -178,20 +206,20 @@ class Correspondence(WorkspaceStructure):
         return False
 
     def build_correspondence(self):
-        workspace.structures += [self]
+        workspace.add_structure(self)
         if self.object_from_initial.correspondence:
             self.object_from_initial.correspondence.break_correspondence()
         if self.object_from_target.correspondence:
             self.object_from_target.correspondence.break_correspondence()
         self.object_from_initial.correspondence = self
         self.object_from_target.correspondence = self
+        workspace.recount(self.object_from_initial, self.object_from_target)
+        workspace.supports.add(self)
         # add mappings to accessory-concept-mapping-list
         relevant_mappings = self.relevant_distinguishing_concept_mappings()
         for mapping in relevant_mappings:
             if mapping.slippage():
                 self.accessory_concept_mappings += [mapping.symmetric_version()]
-        from .group import Group
-
         if isinstance(self.object_from_initial, Group):
             if isinstance(self.object_from_target, Group):
                 bond_mappings = get_mappings(
@@ -212,6 +240,8 @@ class Correspondence(WorkspaceStructure):
         self.break_correspondence()
 
     def break_correspondence(self):
-        workspace.structures.remove(self)
+        workspace.remove_structure(self)
+        workspace.supports.remove(self)
         self.object_from_initial.correspondence = None
         self.object_from_target.correspondence = None
+        workspace.recount(self.object_from_initial, self.object_from_target)
@@ -1,9 +1,11 @@
-import logging
-
+from . import tracing
+from .engine import workspace
 from .workspace_structure import WorkspaceStructure
 
 
 class Description(WorkspaceStructure):
+    __slots__ = ("object", "description_type", "descriptor")
+
     def __init__(self, workspace_object, description_type, descriptor):
         WorkspaceStructure.__init__(self)
         self.object = workspace_object
@@ -15,12 +17,17 @@ class Description(WorkspaceStructure):
         return f"<Description: {self}>"
 
     def __str__(self):
-        from .workspace import workspace
-
         descriptor = self.descriptor.get_name()
         container = "initial" if self.object.string == workspace.initial else "target"
         return f"description({descriptor}) of {self.object} in {container} string"
 
+    def strength_inputs(self):
+        return (
+            self.descriptor.conceptual_depth,
+            self.description_type.activation,
+            workspace.descriptions_version(),
+        )
+
     def update_internal_strength(self):
         self.internal_strength = self.descriptor.conceptual_depth
 
@@ -30,8 +37,6 @@ class Description(WorkspaceStructure):
         ) / 2
 
     def local_support(self):
-        from .workspace import workspace
-
         described_like_self = 0
         for other in workspace.other_objects(self.object):
             if self.object.is_within(other) or other.is_within(self.object):
@@ -48,12 +53,9 @@ class Description(WorkspaceStructure):
         self.description_type.buffer = 100.0
         self.descriptor.buffer = 100.0
         if not self.object.described(self.descriptor):
-            logging.info(f"Add {self} to descriptions")
-            self.object.descriptions += [self]
+            tracing.codelets("Add %s to descriptions", self)
+            self.object.append_description(self)
 
     def break_description(self):
-        from .workspace import workspace
-
-        if self in workspace.structures:
-            workspace.structures.remove(self)
-        self.object.descriptions.remove(self)
+        workspace.remove_structure(self)
+        self.object.remove_description(self)
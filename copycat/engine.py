@@ -0,0 +1,113 @@
+"""An engine holds all the state of copycat: slipnet, workspace, coderack, ...
+
+The modules use names like "slipnet" and "workspace" which stand for
+    that part of whichever engine is current
+Each thread (or asyncio task) has its own current engine,
+    so that independent runs can share a process without crosstalk
+If no engine has been made current then a default engine is used
+"""
+
+import contextlib
+import contextvars
+import operator
+import random as random_
+
+_current = contextvars.ContextVar("engine", default=None)
+_default = None
+
+
+class Engine:
+    """One of each part needed to run copycat
+
+    If arrays is true then the slipnet keeps its state in NumPy arrays
+    If bin_urgencies is true then the coderack chooses codelets by bins of urgency
+
+    All random numbers are drawn from the engine's own stream,
+        which is seeded with the seed, if given
+    """
+
+    def __init__(self, arrays=False, seed=None, bin_urgencies=False):
+        from .coderack import CodeRack
+        from .slipnet import SlipNet
+        from .temperature import Temperature
+        from .workspace import Workspace
+        from .workspace_formulas import WorkspaceFormulas
+
+        self.random = random_.Random(seed)
+        with self.activated():
+            if arrays:
+                from .slipnet_arrays import ArraySlipNet
+
+                self.slipnet = ArraySlipNet()
+            else:
+                self.slipnet = SlipNet()
+            self.temperature = Temperature()
+            self.workspace = Workspace()
+            self.workspace_formulas = WorkspaceFormulas()
+            self.coderack = CodeRack(bin_urgencies)
+            self.coderack_pressures = self.coderack.pressures
+
+    def __repr__(self):
+        return f"<Engine for {self.workspace!r}>"
+
+    @contextlib.contextmanager
+    def activated(self):
+        """Make this the current engine, within a with statement"""
+        token = _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+
+    def run(self, initial, modified, target, iterations, processes=1, seed=None):
+        """Run the trials on this engine, as copycat.run() does"""
+        from . import copycat
+
+        with self.activated():
+            return copycat.run(initial, modified, target, iterations, processes, seed)
+
+
+def default_engine():
+    """The engine used when no other is current, made when first needed"""
+    global _default
+    if _default is None:
+        _default = Engine()
+    return _default
+
+
+def current_engine():
+    return _current.get() or default_engine()
+
+
+def engine_part(name):
+    """A stand-in for that part of the current engine
+
+    Getting or setting any attribute of the stand-in
+        gets or sets it on the part of the current engine
+    """
+    get_part = operator.attrgetter(name)
+
+    class EnginePart:
+        __slots__ = ()
+
+        def __getattribute__(self, attribute):
+            return getattr(get_part(_current.get() or default_engine()), attribute)
+
+        def __setattr__(self, attribute, value):
+            setattr(get_part(_current.get() or default_engine()), attribute, value)
+
+        def __repr__(self):
+            return repr(get_part(_current.get() or default_engine()))
+
+    return EnginePart()
+
+
+# The parts of the current engine, used like modules
+# e.g. random stands for the random numbers of the current engine
+random = engine_part("random")
+slipnet = engine_part("slipnet")
+temperature = engine_part("temperature")
+workspace = engine_part("workspace")
+workspace_formulas = engine_part("workspace_formulas")
+coderack = engine_part("coderack")
+coderack_pressures = engine_part("coderack_pressures")
@@ -1,19 +1,20 @@
-import logging
 import math
-import random
+from typing import Dict
 from typing import List
 
-from .temperature import temperature
+from . import tracing
 from .concept_mapping import ConceptMapping
-
-actual_temperature = Temperature = 100.0
+from .description import Description
+from .engine import random
+from .engine import temperature
+from .slipnode import Slipnode
 
 
 def select_list_position(probabilities):
     total = sum(probabilities)
-    logging.info(f"Total of probabilities: {total}")
+    tracing.codelets("Total of probabilities: %s", total)
     stop_position = total * random.random()
-    logging.info(f"stop_position: {stop_position}")
+    tracing.codelets("stop_position: %s", stop_position)
     total = 0
     index = 0
     for probability in probabilities:
@@ -36,29 +37,37 @@ def weighted_average(values):
 
 
 def log_temperature():
-    logging.info(f"Temperature: {Temperature}")
+    tracing.temperature("Temperature: %s", temperature.value)
 
 
 def log_actual_temperature():
-    logging.info(f"actual_temperature: {actual_temperature}")
+    tracing.temperature("actual_temperature: %s", temperature.actual)
 
 
 def clamp_actual_temperature():
-    global actual_temperature
-    actual_temperature = 100.0
+    temperature.actual = 100.0
     log_actual_temperature()
 
 
 def weigh_actual_temperature(values):
-    global actual_temperature
-    actual_temperature = weighted_average(values)
+    temperature.actual = weighted_average(values)
     log_actual_temperature()
 
 
 def temperature_adjusted_value(value):
-    log_temperature()
-    log_actual_temperature()
-    return value ** (((100.0 - Temperature) / 30.0) + 0.5)
+    return value**temperature.exponent
+
+
+def temperature_adjusted_depth(depth):
+    """The temperature-adjusted value of a conceptual depth
+
+    There are few depths, so values are kept until the temperature changes
+    """
+    adjusted_depths = temperature.adjusted_depths
+    value = adjusted_depths.get(depth)
+    if value is None:
+        value = adjusted_depths[depth] = temperature_adjusted_value(depth)
+    return value
 
 
 def temperature_adjusted_probability(value):
@@ -66,11 +75,7 @@ def temperature_adjusted_probability(value):
         return value
     if value < 0.5:
         return 1.0 - temperature_adjusted_probability(1.0 - value)
-    coldness = 100.0 - temperature.value
-    cold = math.sqrt(coldness)
-    warm = 10.0 - cold
-    centi_warm = warm / 100
-    norm_warm = centi_warm * (1.0 - (1.0 - value))  # as said the java
+    norm_warm = temperature.centi_warm * (1.0 - (1.0 - value))  # as said the java
     norm_cold = (1.0 - value) + norm_warm
     result = 1.0 - norm_cold
     return max(result, 0.5)
@@ -94,10 +99,12 @@ def choose_object_from_list(objects, attribute):
     for object_ in objects:
         value = getattr(object_, attribute)
         probability = temperature_adjusted_value(value)
-        logging.info(f"Object: {object_}, value: {value}, probability: {probability}")
+        tracing.codelets(
+            "Object: %s, value: %s, probability: %s", object_, value, probability
+        )
         probabilities += [probability]
     selected = select_list_position(probabilities)
-    logging.info(f"Selected: {selected}")
+    tracing.codelets("Selected: %s", selected)
     return objects[selected]
 
 
@@ -123,7 +130,7 @@ def similar_property_links(slip_node):
 def choose_slipnode_by_conceptual_depth(slip_nodes):
     if not slip_nodes:
         return None
-    depths = [temperature_adjusted_value(_.conceptual_depth) for _ in slip_nodes]
+    depths = [temperature_adjusted_depth(_.conceptual_depth) for _ in slip_nodes]
     selected = select_list_position(depths)
     return slip_nodes[selected]
 
@@ -138,10 +145,10 @@ def __relevant_direction(object_, slipnode):
 
 def __local_relevance(string, slipnode, relevance):
     number_of_objects_not_spanning = number_of_matches = 0.0
-    logging.info(f"find relevance for a string: {string}")
+    tracing.codelets("find relevance for a string: %s", string)
     for object_ in string.objects:
         if not object_.spans_string():
-            logging.info(f"Non spanner: {object_}")
+            tracing.codelets("Non spanner: %s", object_)
             number_of_objects_not_spanning += 1.0
             if relevance(object_, slipnode):
                 number_of_matches += 1.0
@@ -164,21 +171,22 @@ def get_mappings(
     object_from_initial, object_from_target, initial_descriptions, target_descriptions
 ) -> List[ConceptMapping]:
     mappings = []
-
+    targets_by_type: Dict[Slipnode, List[Description]] = {}
+    for target in target_descriptions:
+        targets_by_type.setdefault(target.description_type, []).append(target)
     for initial in initial_descriptions:
-        for target in target_descriptions:
-            if initial.description_type == target.description_type:
-                if (
-                    initial.descriptor == target.descriptor
-                    or initial.descriptor.slip_linked(target.descriptor)
-                ):
-                    mapping = ConceptMapping(
-                        initial.description_type,
-                        target.description_type,
-                        initial.descriptor,
-                        target.descriptor,
-                        object_from_initial,
-                        object_from_target,
-                    )
-                    mappings += [mapping]
+        for target in targets_by_type.get(initial.description_type, []):
+            if (
+                initial.descriptor == target.descriptor
+                or initial.descriptor.slip_linked(target.descriptor)
+            ):
+                mapping = ConceptMapping(
+                    initial.description_type,
+                    target.description_type,
+                    initial.descriptor,
+                    target.descriptor,
+                    object_from_initial,
+                    object_from_target,
+                )
+                mappings += [mapping]
     return mappings
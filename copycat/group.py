@@ -1,12 +1,23 @@
-import logging
-import random
-
 from . import formulas
-from .slipnet import slipnet
+from . import tracing
+from .description import Description
+from .engine import random
+from .engine import slipnet
+from .engine import workspace
 from .workspace_object import WorkspaceObject
 
 
 class Group(WorkspaceObject):
+    __slots__ = (
+        "group_category",
+        "direction_category",
+        "facet",
+        "object_list",
+        "bond_list",
+        "bond_category",
+        "bond_descriptions",
+    )
+
     def __init__(
         self, string, group_category, direction_category, facet, object_list, bond_list
     ):
@@ -25,7 +36,6 @@ class Group(WorkspaceObject):
         self.right_index = right_object.right_index
         self.rightmost = self.right_index == len(self.string)
 
-        self.descriptions = []
         self.bond_descriptions = []
         self.extrinsic_descriptions = []
         self.outgoing_bonds = []
@@ -39,8 +49,6 @@ class Group(WorkspaceObject):
         self.clamp_salience = False
         self.name = ""
 
-        from .description import Description
-
         if self.bond_list and len(self.bond_list):
             first_facet = self.bond_list[0].facet
             self.add_bond_description(
@@ -122,19 +130,19 @@ class Group(WorkspaceObject):
         )
 
     def build_group(self):
-        from .workspace import workspace
-
         workspace.objects += [self]
-        workspace.structures += [self]
-        self.string.objects += [self]
+        workspace.add_structure(self)
+        self.string.add_object(self)
         for object_ in self.object_list:
             object_.group = self
+        workspace.recount(*self.object_list)
+        workspace.count(self)
         workspace.build_descriptions(self)
         self.activate_descriptions()
 
     def activate_descriptions(self):
         for description in self.descriptions:
-            logging.info(f"Activate: {description}")
+            tracing.codelets("Activate: %s", description)
             description.descriptor.buffer = 100.0
 
     def length_description_probability(self):
@@ -158,16 +166,16 @@ class Group(WorkspaceObject):
             description.break_description()
         for object_ in self.object_list:
             object_.group = None
+        workspace.recount(*self.object_list)
         if self.group:
             self.group.break_group()
-        from .workspace import workspace
 
-        if self in workspace.structures:
-            workspace.structures.remove(self)
+        workspace.remove_structure(self)
         if self in workspace.objects:
             workspace.objects.remove(self)
+            workspace.uncount(self)
         if self in self.string.objects:
-            self.string.objects.remove(self)
+            self.string.remove_object(self)
         if self.correspondence:
             self.correspondence.break_correspondence()
         if self.left_bond:
@@ -175,6 +183,10 @@ class Group(WorkspaceObject):
         if self.right_bond:
             self.right_bond.break_bond()
 
+    def strength_inputs(self):
+        related_bond = self.group_category.get_related_node(slipnet.bond_category)
+        return related_bond.degree_of_association(), self.string.structures_version
+
     def update_internal_strength(self):
         related_bond_association = self.group_category.get_related_node(
             slipnet.bond_category
@@ -254,11 +266,8 @@ class Group(WorkspaceObject):
         """Whether no other object of the same type has the same descriptor"""
         if not WorkspaceObject.distinguishing_descriptor(descriptor):
             return False
-        for object_ in self.string.objects:
-            # check to see if they are of the same type
-            if isinstance(object_, Group) and object_ != self:
-                # check all descriptions for the descriptor
-                for description in object_.descriptions:
-                    if description.descriptor == descriptor:
-                        return False
-        return True
+        # check other objects of the same type with the descriptor
+        return not any(
+            isinstance(_, Group) and _ != self
+            for _ in self.string.objects_described_by(descriptor)
+        )
@@ -1,4 +1,4 @@
-from .workspace import workspace
+from .engine import workspace
 
 
 class GroupRun:
@@ -0,0 +1,41 @@
+"""A set whose members can also be indexed, e.g. to choose one at random"""
+
+
+class IndexedSet:
+    """Members kept in a list, with the position of each in a dict
+
+    So adding, removing, testing membership and indexing
+        all take constant time
+    Removing a member moves the last member into its place
+    """
+
+    def __init__(self):
+        self.members = []
+        self.positions = {}
+
+    def __len__(self):
+        return len(self.members)
+
+    def __iter__(self):
+        return iter(self.members)
+
+    def __contains__(self, member):
+        return member in self.positions
+
+    def __getitem__(self, index):
+        return self.members[index]
+
+    def add(self, member):
+        if member in self.positions:
+            return
+        self.positions[member] = len(self.members)
+        self.members += [member]
+
+    def discard(self, member):
+        position = self.positions.pop(member, None)
+        if position is None:
+            return
+        last = self.members.pop()
+        if last is not member:
+            self.members[position] = last
+            self.positions[last] = position
@@ -1,18 +1,19 @@
-from .slipnet import slipnet
+from .engine import slipnet
+from .engine import workspace
 from .workspace_object import WorkspaceObject
 
 
 class Letter(WorkspaceObject):
+    __slots__ = ("workspace_string",)
+
     def __init__(self, string, position, length):
         WorkspaceObject.__init__(self, string)
-        from .workspace import workspace
-
         workspace.objects += [self]
-        string.objects += [self]
         self.left_index = position
         self.leftmost = self.left_index == 1
         self.right_index = position
         self.rightmost = self.right_index == length
+        string.add_object(self)
 
     def describe(self, position, length):
         if length == 1:
@@ -42,11 +43,8 @@ class Letter(WorkspaceObject):
         """Whether no other object of the same type has the same descriptor"""
         if not WorkspaceObject.distinguishing_descriptor(descriptor):
             return False
-        for object_ in self.string.objects:
-            # check to see if they are of the same type
-            if isinstance(object_, Letter) and object_ != self:
-                # check all descriptions for the descriptor
-                for description in object_.descriptions:
-                    if description.descriptor == descriptor:
-                        return False
-        return True
+        # check other objects of the same type with the descriptor
+        return not any(
+            isinstance(_, Letter) and _ != self
+            for _ in self.string.objects_described_by(descriptor)
+        )
@@ -2,6 +2,8 @@ from .workspace_structure import WorkspaceStructure
 
 
 class Replacement(WorkspaceStructure):
+    __slots__ = ("object_from_initial", "object_from_modified", "relation")
+
     def __init__(self, object_from_initial, object_from_modified, relation):
         WorkspaceStructure.__init__(self)
         self.object_from_initial = object_from_initial
@@ -1,8 +1,7 @@
-import logging
-
+from . import tracing
+from .engine import slipnet
+from .engine import workspace
 from .formulas import weighted_average
-from .slipnet import slipnet
-from .workspace import workspace
 from .workspace_structure import WorkspaceStructure
 
 
@@ -135,7 +134,7 @@ class Rule(WorkspaceStructure):
             if _.described(self.descriptor) and _.described(self.category)
         ]
         changed = changeds and changeds[0] or None
-        logging.debug(f"changed object = {changed}")
+        tracing.codelets("changed object = %s", changed)
         if changed:
             left = changed.left_index
             start_string = ""
@@ -1,4 +1,6 @@
 class Sliplink:
+    __slots__ = ("source", "destination", "label", "fixed_length")
+
     def __init__(self, source, destination, label=None, length=0.0):
         self.source = source
         self.destination = destination
@@ -1,5 +1,7 @@
 import logging
 
+from .concept_mapping import MappingKind
+from .engine import slipnet
 from .sliplink import Sliplink
 from .slipnode import Slipnode
 
@@ -17,6 +19,12 @@ def distinguishing_descriptor(descriptor):
 
 
 class SlipNet:
+    """The network of concepts, their links, and how active each concept is
+
+    Building the network takes well under a millisecond,
+        less than copying or unpickling one, so each engine builds its own
+    """
+
     def __init__(self):
         logging.debug("SlipNet.__init__()")
         self.initially_clamped_slipnodes = []
@@ -25,8 +33,12 @@ class SlipNet:
         self.bond_facets = []
         self.time_step_ength = 15
         self.number_of_updates = 0
+        # kinds of concept mapping, by description types and descriptors
+        self.mapping_kinds = {}
         self.__add_initial_nodes()
         self.__add_initial_links()
+        for node in self.slipnodes:
+            node.index_links()
         self.predecessor = None
 
     def __repr__(self):
@@ -36,6 +48,13 @@ class SlipNet:
         logging.debug(f"slipnet set all depths to {depth}")
         _ = [node.set_conceptual_depth(depth) for node in self.slipnodes]
 
+    def mapping_kind(self, *concepts):
+        """The kind of concept mapping between two description types and descriptors"""
+        kind = self.mapping_kinds.get(concepts)
+        if kind is None:
+            kind = self.mapping_kinds[concepts] = MappingKind(*concepts)
+        return kind
+
     def reset(self):
         logging.debug("slipnet.reset()")
         self.number_of_updates = 0
@@ -271,8 +290,11 @@ class SlipNet:
         self.__add_slip_link(source, destination, label=self.opposite)
         self.__add_slip_link(destination, source, label=self.opposite)
 
+    def make_node(self, name, depth, length):
+        return Slipnode(name, depth, length)
+
     def __add_node(self, name, depth, length=0):
-        slipnode = Slipnode(name, depth, length)
+        slipnode = self.make_node(name, depth, length)
         self.slipnodes += [slipnode]
         return slipnode
 
@@ -282,6 +304,3 @@ class SlipNet:
             self.__add_non_slip_link(previous, item, label=self.successor)
             self.__add_non_slip_link(item, previous, label=self.predecessor)
             previous = item
-
-
-slipnet = SlipNet()
@@ -0,0 +1,126 @@
+"""A slipnet which keeps the state of its slipnodes in NumPy arrays
+
+Activation, buffer, conceptual depth and clamping of all slipnodes are held
+    in arrays, and the sliplinks as a sparse list of weighted edges,
+    so that one update of the slipnet is a handful of vector operations
+
+The slipnodes are views over those arrays, so codelets use them as usual
+
+NumPy is optional: only this module needs it
+"""
+
+from .engine import random
+from .slipnet import SlipNet
+from .slipnode import Slipnode, full_activation, jump_threshold
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    # ArraySlipNet() checks for this before any array is made
+    numpy = None  # type: ignore[assignment]
+
+
+class SlipnodeArrays:
+    """The state of all slipnodes, one element per slipnode"""
+
+    def __init__(self):
+        self.activation = numpy.zeros(0)
+        self.buffer = numpy.zeros(0)
+        self.conceptual_depth = numpy.zeros(0)
+        self.clamped = numpy.zeros(0, dtype=bool)
+        self.sources = numpy.zeros(0, dtype=int)
+        self.destinations = numpy.zeros(0, dtype=int)
+        self.weights = numpy.zeros(0)
+
+    def __len__(self):
+        return len(self.activation)
+
+    def add(self):
+        """Add room for one more slipnode, returning its index"""
+        index = len(self)
+        self.activation = numpy.append(self.activation, 0.0)
+        self.buffer = numpy.append(self.buffer, 0.0)
+        self.conceptual_depth = numpy.append(self.conceptual_depth, 0.0)
+        self.clamped = numpy.append(self.clamped, False)
+        return index
+
+    def link(self, sliplinks):
+        """Hold the sliplinks as edges, weighted by how they spread activation"""
+        self.sources = numpy.array([_.source.index for _ in sliplinks], dtype=int)
+        self.destinations = numpy.array(
+            [_.destination.index for _ in sliplinks], dtype=int
+        )
+        self.weights = numpy.array(
+            [_.intrinsic_degree_of_association() for _ in sliplinks]
+        )
+
+
+def _array_attribute(name):
+    """A property of a slipnode held at its index in one of the arrays"""
+
+    def get(node):
+        return getattr(node.arrays, name)[node.index].item()
+
+    def set_(node, value):
+        getattr(node.arrays, name)[node.index] = value
+
+    return property(get, set_)
+
+
+class ArraySlipnode(Slipnode):
+    """A slipnode whose state is a view over SlipnodeArrays"""
+
+    activation = _array_attribute("activation")
+    buffer = _array_attribute("buffer")
+    conceptual_depth = _array_attribute("conceptual_depth")
+    clamped = _array_attribute("clamped")
+
+    def __init__(self, arrays, name, depth, length=0.0):
+        self.arrays = arrays
+        self.index = arrays.add()
+        super().__init__(name, depth, length)
+
+
+class ArraySlipNet(SlipNet):
+    """A slipnet which updates all its slipnodes at once"""
+
+    def __init__(self):
+        if numpy is None:
+            raise ImportError("ArraySlipNet needs numpy")
+        self.arrays = SlipnodeArrays()
+        super().__init__()
+        self.arrays.link(self.sliplinks)
+        self.generator = None
+
+    def reset(self):
+        super().reset()
+        self.generator = numpy.random.default_rng(random.getrandbits(64))
+
+    def make_node(self, name, depth, length):
+        return ArraySlipnode(self.arrays, name, depth, length)
+
+    def update(self):
+        self.number_of_updates += 1
+        if self.number_of_updates == 50:
+            _ = [node.unclamp() for node in self.initially_clamped_slipnodes]
+        arrays = self.arrays
+        activation, buffer = arrays.activation, arrays.buffer
+        # decay
+        buffer -= activation * (100.0 - arrays.conceptual_depth) / 100.0
+        # spread from fully active nodes along their links
+        float_margin = 0.00001
+        fully_active = activation > full_activation() - float_margin
+        buffer += numpy.bincount(
+            arrays.destinations,
+            weights=arrays.weights * fully_active[arrays.sources],
+            minlength=len(arrays),
+        )
+        # add the buffer, then jump
+        unclamped = ~arrays.clamped
+        activation += numpy.where(unclamped, buffer, 0.0)
+        numpy.clip(activation, 0.0, 100.0, out=activation)
+        chances = (activation / 100.0) ** 3
+        jumps = (activation > jump_threshold()) & unclamped
+        jumps &= self.generator.random(len(arrays)) < chances
+        activation[jumps] = full_activation()
+        buffer[:] = 0.0
@@ -1,6 +1,8 @@
 import logging
 import math
-from random import random
+
+from .engine import random
+from .engine import slipnet
 
 
 def full_activation():
@@ -11,11 +13,6 @@ def jump_threshold():
     return 55.0
 
 
-def points_at(links, other):
-    """Whether any of the links points at the other"""
-    return any(_.points_at(other) for _ in links)
-
-
 class Slipnode:
     def __init__(self, name, depth, length=0.0):
         self.conceptual_depth = depth
@@ -35,6 +32,10 @@ class Slipnode:
         self.lateral_non_slip_links = []
         self.incoming_links = []
         self.outgoing_links = []
+        # the first outgoing link to each destination, with each label, ...
+        self.links_to = {}
+        self.links_labelled = {}
+        self.slip_links_to = {}
         self.codelets = []
         self.clamp_bond_degree_of_association = False
 
@@ -95,13 +96,28 @@ class Slipnode:
         self.old_activation = act
         self.buffer -= self.activation * (100.0 - self.conceptual_depth) / 100.0
 
+    def index_links(self):
+        """Index the links by destination and label
+
+        The links do not change once the slipnet is made,
+            so this is done once, when all links are made
+        """
+        self.links_to = {}
+        self.links_labelled = {}
+        for link in self.outgoing_links:
+            self.links_to.setdefault(link.destination, link)
+            self.links_labelled.setdefault(link.label, link)
+        self.slip_links_to = {}
+        for link in self.lateral_slip_links:
+            self.slip_links_to.setdefault(link.destination, link)
+
     def linked(self, other):
         """Whether the other is among the outgoing links"""
-        return points_at(self.outgoing_links, other)
+        return other in self.links_to
 
     def slip_linked(self, other):
         """Whether the other is among the lateral links"""
-        return points_at(self.lateral_slip_links, other)
+        return other in self.slip_links_to
 
     def related(self, other):
         """Same or linked"""
@@ -118,15 +134,11 @@ class Slipnode:
 
         If no linked node is found, return None
         """
-        from .slipnet import slipnet
-
         if relation == slipnet.identity:
             return self
-        destinations = [
-            _.destination for _ in self.outgoing_links if _.label == relation
-        ]
-        if destinations:
-            return destinations[0]
+        link = self.links_labelled.get(relation)
+        if link:
+            return link.destination
         return None
 
     def get_bond_category(self, destination):
@@ -134,21 +146,12 @@ class Slipnode:
 
         If it does not exist return None
         """
-        from .slipnet import slipnet
-
-        result = None
         if self == destination:
-            result = slipnet.identity
-        else:
-            for link in self.outgoing_links:
-                if link.destination == destination:
-                    result = link.label
-                    break
-        if result:
-            logging.info(f"Got bond: {result.name}")
-        else:
-            logging.info("Got no bond")
-        return result
+            return slipnet.identity
+        link = self.links_to.get(destination)
+        if link:
+            return link.label
+        return None
 
     def spread_activation(self):
         if self.fully_active():
@@ -165,7 +168,7 @@ class Slipnode:
         if self.clamped:
             return False
         value = (self.activation / 100.0) ** 3
-        return random() < value
+        return random.random() < value
 
     def jump(self):
         if self.can_jump():
@@ -0,0 +1,68 @@
+"""A binary tree of sums, for weighted choices in logarithmic time"""
+
+
+class SumTree:
+    """Weights held at the leaves of a binary tree
+
+    Each branch holds the sum of the leaves below it, so that changing a weight,
+    or finding the leaf at a cumulative weight, only walks one path of the tree
+    """
+
+    def __init__(self, capacity=1):
+        self.capacity = 1
+        while self.capacity < capacity:
+            self.capacity *= 2
+        self.sums = [0.0] * (2 * self.capacity)
+
+    def __len__(self):
+        return self.capacity
+
+    def __getitem__(self, index):
+        return self.sums[self.capacity + index]
+
+    def __setitem__(self, index, weight):
+        if index >= self.capacity:
+            self.grow(index + 1)
+        position = self.capacity + index
+        self.sums[position] = weight
+        position //= 2
+        while position:
+            self.sums[position] = self.sums[2 * position] + self.sums[2 * position + 1]
+            position //= 2
+
+    def total(self):
+        return self.sums[1]
+
+    def grow(self, capacity):
+        """Double the capacity until it holds that many leaves"""
+        weights = self.sums[self.capacity :]
+        while self.capacity < capacity:
+            self.capacity *= 2
+        self.fill(weights)
+
+    def fill(self, weights):
+        """Replace all leaves with the given weights, at once"""
+        self.sums = [0.0] * (2 * self.capacity)
+        self.sums[self.capacity : self.capacity + len(weights)] = weights
+        for position in range(self.capacity - 1, 0, -1):
+            self.sums[position] = self.sums[2 * position] + self.sums[2 * position + 1]
+
+    def find(self, threshold, factor=1.0, offsets=None):
+        """The index of the first leaf where the cumulative weight exceeds threshold
+
+        The weight of each leaf is multiplied by the factor
+            and, if given, has the same leaf of the offsets tree taken away
+
+        If the threshold is not less than the total weight then the last leaf
+            is returned
+        """
+        position = 1
+        while position < self.capacity:
+            position *= 2
+            weight = factor * self.sums[position]
+            if offsets is not None:
+                weight -= offsets.sums[position]
+            if threshold >= weight:
+                threshold -= weight
+                position += 1
+        return position - self.capacity
@@ -0,0 +1,54 @@
+"""Which correspondences support which, for their external strengths"""
+
+
+class SupportGraph:
+    """For each built correspondence, the built correspondences it supports
+
+    Edges are added and removed as correspondences are built and broken
+
+    Whether one correspondence supports another depends on which of their
+        concept mappings are distinguishing, and so on the descriptions
+        in the strings, so all edges are found again if those have changed
+    """
+
+    def __init__(self):
+        self.edges = {}
+        self.version = None
+
+    def add(self, correspondence):
+        self.__refresh(correspondence.descriptions_version())
+        edges = {}
+        for other, other_edges in self.edges.items():
+            if correspondence.supporting(other):
+                edges[other] = None
+            if other.supporting(correspondence):
+                other_edges[correspondence] = None
+        self.edges[correspondence] = edges
+
+    def remove(self, correspondence):
+        if self.edges.pop(correspondence, None) is None:
+            return
+        for edges in self.edges.values():
+            edges.pop(correspondence, None)
+
+    def update(self, correspondence):
+        """Find the edges again for a correspondence whose mappings changed"""
+        if correspondence in self.edges:
+            self.remove(correspondence)
+            self.add(correspondence)
+
+    def supported(self, correspondence):
+        """The built correspondences which the correspondence supports"""
+        self.__refresh(correspondence.descriptions_version())
+        if correspondence in self.edges:
+            return self.edges[correspondence]
+        return [_ for _ in self.edges if correspondence.supporting(_)]
+
+    def __refresh(self, version):
+        if version == self.version:
+            return
+        self.version = version
+        self.edges = {
+            one: {other: None for other in self.edges if one.supporting(other)}
+            for one in self.edges
+        }
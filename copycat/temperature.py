@@ -1,25 +1,32 @@
-import logging
+import math
+
+from . import tracing
+from .engine import coderack
 
 
 class Temperature:
     def __init__(self):
-        self.value = 100.0
+        self.reset()
+
+    def reset(self):
+        """Start hot, and clamped, as at the start of each trial"""
+        self.update(100.0)
+        self.actual = 100.0
         self.clamped = True
         self.clamp_time = 30
 
     def update(self, value):
-        logging.debug(f"update to {value}")
+        tracing.temperature("update to %s", value)
         self.value = value
+        # terms of the temperature-adjusted formulas, kept until the next update
+        self.exponent = ((100.0 - value) / 30.0) + 0.5
+        self.centi_warm = (10.0 - math.sqrt(100.0 - value)) / 100
+        self.adjusted_depths = {}
 
     def try_unclamp(self):
-        from .coderack import coderack
-
         if self.clamped and coderack.codelets_run >= self.clamp_time:
-            logging.info(f"unclamp temperature at {coderack.codelets_run}")
+            tracing.temperature("unclamp temperature at %s", coderack.codelets_run)
             self.clamped = False
 
     def log(self):
-        logging.debug(f"temperature.value: {self.value}")
-
-
-temperature = Temperature()
+        tracing.temperature("temperature.value: %s", self.value)
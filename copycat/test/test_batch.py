@@ -0,0 +1,52 @@
+import io
+import json
+import unittest
+
+from copycat import batch
+
+
+class TestBatch(unittest.TestCase):
+    def test_parse_problem(self):
+        """CSV and JSON lines should give the same problems"""
+        expected = {
+            "initial": "abc",
+            "modified": "abd",
+            "target": "ijk",
+            "iterations": 3,
+            "seed": None,
+        }
+        self.assertEqual(batch.parse_problem("abc, abd, ijk, 3"), expected)
+        line = '{"initial": "abc", "modified": "abd", "target": "ijk"}'
+        self.assertEqual(batch.parse_problem(line, iterations=3), expected)
+        self.assertIsNone(batch.parse_problem("initial,modified,target"))
+        self.assertIsNone(batch.parse_problem("# a comment"))
+        for line in (
+            "abc,ab1,ijk",
+            "ABC,ABD,IJK",
+            "abc,abd,ijk,0",
+            "abc,abd,ijk,3,x",
+            '{"initial": "abc", "modified": "abd", "target": "ijk", "seed": [1]}',
+            '{"initial": "abc", "modified": "abd", "target": "ijk", "iterations": {}}',
+        ):
+            with self.assertRaises(ValueError):
+                batch.parse_problem(line)
+
+    def test_run_batch(self):
+        """Each line should give a line of results, or of an error"""
+        lines = ["abc,abd,ijk,2,1", "", "abc,abd", '{"initial": "abc"']
+        output = io.StringIO()
+        self.assertEqual(batch.run_batch(lines, output), 2)
+        results = [json.loads(_) for _ in output.getvalue().splitlines()]
+        self.assertEqual(len(results), 3)
+        self.assertEqual(sum(_["count"] for _ in results[0]["answers"].values()), 2)
+        self.assertEqual([_.get("line") for _ in results], [None, 3, 4])
+
+    def test_problems_are_independent(self):
+        """A seeded problem's answers should not depend on the problems before it"""
+        output = io.StringIO()
+        batch.run_batch(["abc,abd,xyz,3,12", "abc,abd,ijk,2,7"], output)
+        after = json.loads(output.getvalue().splitlines()[-1])
+        output = io.StringIO()
+        batch.run_batch(["abc,abd,ijk,2,7"], output)
+        alone = json.loads(output.getvalue())
+        self.assertEqual(after["answers"], alone["answers"])
@@ -0,0 +1,43 @@
+import unittest
+
+from copycat import bench
+
+
+class TestBench(unittest.TestCase):
+    def test_chi_square_survival(self):
+        """Chances should match tables of the chi-square distribution"""
+        self.assertAlmostEqual(bench.chi_square_survival(3.841459, 1), 0.05, 6)
+        self.assertAlmostEqual(bench.chi_square_survival(10.0, 4), 0.040428, 6)
+        self.assertAlmostEqual(bench.chi_square_survival(1.0, 5), 0.962566, 6)
+
+    def test_g_test(self):
+        """Only histograms in different proportions should differ significantly"""
+        same = bench.g_test({"ijl": 18, "ijd": 2}, {"ijl": 36, "ijd": 4})
+        self.assertEqual(same, (0.0, 1.0))
+        _, chance = bench.g_test({"ijl": 18, "ijd": 2}, {"ijl": 2, "ijd": 18})
+        self.assertLess(chance, 0.001)
+
+    def test_compare(self):
+        """Speed ups should be None without a baseline speed"""
+        report = {"problems": {"abc:abd::ijk": {}, "abc:abd::xyz": {}}}
+        for result in report["problems"].values():
+            result.update(answers={"ijl": 2}, codelets_per_second=500.0)
+        baseline = {
+            "problems": {
+                "abc:abd::ijk": {"answers": {"ijl": 2}, "codelets_per_second": 0},
+                "abc:abd::xyz": {"answers": {"ijl": 2}},
+            }
+        }
+        self.assertEqual(bench.compare(report, baseline), [])
+        for result in report["problems"].values():
+            self.assertIsNone(result["baseline"]["speed_up"])
+        baseline["problems"]["abc:abd::ijk"]["codelets_per_second"] = 250.0
+        bench.compare(report, baseline)
+        self.assertEqual(report["problems"]["abc:abd::ijk"]["baseline"]["speed_up"], 2)
+
+    def test_bench_problem(self):
+        """A report should count each trial's answer"""
+        result = bench.bench_problem(("abc", "abd", "ijk"), 2, seed=1)
+        self.assertEqual(sum(result["answers"].values()), 2)
+        self.assertGreater(result["codelets_per_second"], 0)
+        self.assertGreaterEqual(result["collections_per_trial"], 0)
@@ -0,0 +1,31 @@
+import inspect
+import unittest
+
+from copycat.engine import Engine
+
+
+class TestCodeRack(unittest.TestCase):
+    def test_codelet_methods(self):
+        """Every codelet method should be called with just the codelet"""
+        coderack = Engine().coderack
+        coderack.get_codeletmethods()
+        self.assertEqual(len(coderack.methods), 24)
+        for method in coderack.methods.values():
+            parameters = inspect.signature(method).parameters
+            self.assertEqual(len(parameters), 1)
+
+    def test_pressures_follow_codelets(self):
+        """Pressures should count only the codelets still on the coderack"""
+        engine = Engine()
+        coderack = engine.coderack
+        with engine.activated():
+            engine.workspace.set_strings("abc", "abd", "ijk")
+            engine.workspace.reset()
+            coderack.reset()
+            coderack.post_initial_codelets()
+            for codelet in list(coderack.codelets)[::2]:
+                coderack.remove_codelet(codelet)
+        expected = sum(1 for _ in coderack.codelets if _.pressure)
+        actual = sum(sum(_.urgencies.values()) for _ in coderack.pressures.pressures)
+        self.assertEqual(actual, expected)
+        self.assertIs(engine.coderack_pressures, coderack.pressures)
@@ -0,0 +1,77 @@
+import unittest
+
+from copycat import copycat
+from copycat.engine import Engine
+from copycat.urgencies import BinnedUrgencies
+
+
+class TestCopycat(unittest.TestCase):
+    def test_seeded_runs_repeat(self):
+        """The same seed should give the same answers, however they are run"""
+        expected = copycat.run("abc", "abd", "ijk", 3, seed=1)
+        self.assertEqual(Engine().run("abc", "abd", "ijk", 3, seed=1), expected)
+        actual = copycat.run("abc", "abd", "ijk", 3, processes=2, seed=1)
+        self.assertEqual(actual, expected)
+
+    def test_trials_replay(self):
+        """Trials should not depend on earlier trials, as when translations fail"""
+        expected = copycat.run("abc", "abd", "xyz", 6, seed=12)
+        actual = copycat.run("abc", "abd", "xyz", 6, processes=3, seed=12)
+        self.assertEqual(actual, expected)
+        seeds = copycat.trial_seeds(6, 12)
+        with Engine().activated():
+            copycat.workspace.set_strings("abc", "abd", "xyz")
+            for seed in seeds[:4]:
+                answers = {}
+                copycat.run_trial(answers, seed)
+        with Engine().activated():
+            replayed = copycat.run_seeded_trials("abc", "abd", "xyz", seeds[3:4])
+        self.assertEqual(replayed, answers)
+
+    def test_counts_follow_workspace(self):
+        """Live counts of objects should match a count of all objects"""
+        engine = Engine()
+        engine.workspace.check_counts = True
+        answers = engine.run("abc", "abd", "mrrjjj", 2, seed=5)
+        self.assertEqual(sum(_["count"] for _ in answers.values()), 2)
+
+    def test_binned_urgencies(self):
+        """Trials should run, and keep counts, with codelets chosen by bins"""
+        engine = Engine(seed=1, bin_urgencies=True)
+        self.assertIsInstance(engine.coderack.urgencies, BinnedUrgencies)
+        engine.workspace.check_counts = True
+        answers = engine.run("abc", "abd", "mrrjjj", 2, seed=5)
+        self.assertEqual(sum(_["count"] for _ in answers.values()), 2)
+
+    def test_strengths_follow_inputs(self):
+        """Strengths left alone should be those a full update would give"""
+        engine = Engine()
+        engine.workspace.check_updates = True
+        answers = engine.run("abc", "abd", "iijjkk", 2, seed=3)
+        self.assertEqual(sum(_["count"] for _ in answers.values()), 2)
+
+    def test_wilson_interval(self):
+        """Intervals should match published examples, and narrow with trials"""
+        low, high = copycat.wilson_interval(81, 263)
+        self.assertAlmostEqual(low, 0.2553, 4)
+        self.assertAlmostEqual(high, 0.3662, 4)
+        widths = [_[1] - _[0] for _ in map(copycat.wilson_interval, (10, 20), (10, 20))]
+        self.assertLess(widths[1], widths[0])
+
+    def test_run_until_confident(self):
+        """Trials should stop once the leading answer is known well enough"""
+        answers = copycat.run_until_confident("abc", "abd", "ijk", 100, 0.1, seed=1)
+        trials = sum(_["count"] for _ in answers.values())
+        self.assertLess(trials, 100)
+        low, high = answers["ijl"]["interval"]
+        self.assertLessEqual(high - low, 0.2)
+
+    def test_confident_runs_repeat(self):
+        """The same seed should give the same answers, whatever ran before"""
+        words = "abc", "abd", "ijk"
+        with Engine().activated():
+            expected = copycat.run_until_confident(*words, 20, 0.2, seed=5)
+        with Engine().activated():
+            copycat.run("abc", "abd", "xyz", 3, seed=12)
+            actual = copycat.run_until_confident(*words, 20, 0.2, seed=5)
+        self.assertEqual(actual, expected)
@@ -0,0 +1,28 @@
+import unittest
+
+from copycat.engine import Engine
+from copycat.engine import current_engine
+from copycat.engine import workspace
+
+
+class TestEngine(unittest.TestCase):
+    def test_parts_follow_current_engine(self):
+        """Module level parts should be those of the current engine"""
+        one, two = Engine(), Engine()
+        self.assertIsNot(one.slipnet, two.slipnet)
+        with one.activated():
+            workspace.set_strings("abc", "abd", "ijk")
+            with two.activated():
+                self.assertIs(current_engine(), two)
+                workspace.set_strings("xyz", "xya", "pqr")
+            self.assertIs(current_engine(), one)
+        self.assertEqual(one.workspace.target_string, "ijk")
+        self.assertEqual(two.workspace.target_string, "pqr")
+
+    def test_trials_reset_temperature(self):
+        """A trial should not be clamped by an earlier trial's temperature"""
+        expected = Engine().run("abc", "abd", "ijk", 1, seed=7)
+        engine = Engine()
+        engine.temperature.clamp_time = 10**6
+        engine.temperature.update(50.0)
+        self.assertEqual(engine.run("abc", "abd", "ijk", 1, seed=7), expected)
@@ -0,0 +1,19 @@
+import unittest
+
+from copycat import formulas
+from copycat.engine import Engine
+
+
+class TestFormulas(unittest.TestCase):
+    def test_adjusted_depths(self):
+        """Adjusted depths should be remembered only until the temperature changes"""
+        engine = Engine()
+        with engine.activated():
+            engine.temperature.update(40.0)
+            self.assertEqual(formulas.temperature_adjusted_depth(50.0), 50.0**2.5)
+            engine.temperature.update(70.0)
+            self.assertEqual(formulas.temperature_adjusted_depth(50.0), 50.0**1.5)
+            engine.temperature.update(91.0)
+            self.assertAlmostEqual(
+                formulas.temperature_adjusted_probability(0.8), 0.744
+            )
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+import unittest
+
+# Most seconds which importing the command line may take, from cold
+IMPORT_BUDGET = 0.2
+
+
+class TestImports(unittest.TestCase):
+    def test_import_command_line(self):
+        """Importing the command line should build nothing, and be quick"""
+        code = (
+            "import sys, copycat.__main__, copycat.engine;"
+            "print(copycat.engine._default is None);"
+            "print('copycat.codelet_methods' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.split(), ["True", "False"])
+        times = [_.split("|") for _ in result.stderr.splitlines()]
+        (cumulative,) = [
+            int(_[1]) for _ in times if _[-1].strip() == "copycat.__main__"
+        ]
+        self.assertLess(cumulative / 1e6, IMPORT_BUDGET)
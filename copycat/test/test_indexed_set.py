@@ -0,0 +1,17 @@
+import unittest
+
+from copycat.indexed_set import IndexedSet
+
+
+class TestIndexedSet(unittest.TestCase):
+    def test_add_and_discard(self):
+        """Members should be kept once each, whatever order they leave in"""
+        members = IndexedSet()
+        for member in "abcdb":
+            members.add(member)
+        self.assertEqual(len(members), 4)
+        members.discard("a")
+        members.discard("z")
+        self.assertEqual(sorted(members), ["b", "c", "d"])
+        self.assertNotIn("a", members)
+        self.assertEqual([members[members.positions[_]] for _ in "bcd"], list("bcd"))
@@ -0,0 +1,37 @@
+import unittest
+
+from copycat.slipnet import SlipNet
+
+
+class TestSlipNet(unittest.TestCase):
+    def test_link_lookups(self):
+        """Looking up links should find the first link a scan would find"""
+        slipnet = SlipNet()
+        for node in slipnet.slipnodes:
+            for other in slipnet.slipnodes:
+                links = [_ for _ in node.outgoing_links if _.destination == other]
+                self.assertEqual(node.linked(other), bool(links))
+                if links and node != other:
+                    self.assertEqual(node.get_bond_category(other), links[0].label)
+        self.assertEqual(
+            slipnet.letters[0].get_related_node(slipnet.successor), slipnet.letters[1]
+        )
+        self.assertTrue(slipnet.left.slip_linked(slipnet.right))
+        self.assertFalse(slipnet.left.slip_linked(slipnet.leftmost))
+
+    def test_mapping_kinds(self):
+        """Each kind of concept mapping should be made once, with its relations"""
+        slipnet = SlipNet()
+        position = slipnet.string_position_category
+        direction = slipnet.direction_category
+        ends = slipnet.mapping_kind(
+            position, position, slipnet.leftmost, slipnet.rightmost
+        )
+        same = slipnet.mapping_kind(
+            position, position, slipnet.leftmost, slipnet.rightmost
+        )
+        self.assertIs(ends, same)
+        self.assertEqual(ends.label, slipnet.opposite)
+        sides = slipnet.mapping_kind(direction, direction, slipnet.right, slipnet.right)
+        self.assertEqual(ends.relation(sides), (True, False))
+        self.assertIs(ends.relations[sides], ends.relation(sides))
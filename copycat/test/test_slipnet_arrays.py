@@ -0,0 +1,33 @@
+import unittest
+from unittest import mock
+
+from copycat.slipnet import SlipNet
+from copycat.slipnet_arrays import ArraySlipNet, numpy
+
+
+class NeverJump:
+    def random(self, size=None):
+        if size is None:
+            return 1.0
+        return [1.0] * size
+
+
+@unittest.skipIf(numpy is None, "needs numpy")
+class TestArraySlipNet(unittest.TestCase):
+    def test_update_as_slipnet(self):
+        """Updates should leave the same activations as the slipnet's own"""
+        slipnet, arrays = SlipNet(), ArraySlipNet()
+        for net in slipnet, arrays:
+            net.reset()
+        arrays.generator = NeverJump()
+        for net in slipnet, arrays:
+            for node in net.letters + [net.successor, net.opposite]:
+                node.activate_fully()
+        with mock.patch("copycat.slipnode.random", NeverJump()):
+            for _ in range(60):
+                slipnet.update()
+                arrays.update()
+                expected = [_.activation for _ in slipnet.slipnodes]
+                actual = [_.activation for _ in arrays.slipnodes]
+                for one, two in zip(expected, actual):
+                    self.assertAlmostEqual(one, two)
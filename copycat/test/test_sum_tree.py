@@ -0,0 +1,25 @@
+import unittest
+
+from copycat.sum_tree import SumTree
+
+
+class TestSumTree(unittest.TestCase):
+    def test_find(self):
+        """Leaves should be found where a roulette wheel would stop"""
+        weights = [1.0, 0.0, 2.5, 4.0, 0.5]
+        tree = SumTree()
+        for index, weight in enumerate(weights):
+            tree[index] = weight
+        self.assertEqual(tree.total(), sum(weights))
+        expected = [0, 2, 2, 3, 3, 3, 3, 4]
+        actual = [tree.find(_) for _ in (0.0, 1.0, 3.0, 3.5, 5.0, 6.0, 7.4, 7.5)]
+        self.assertEqual(actual, expected)
+
+    def test_find_with_offsets(self):
+        """Offsets should be taken from the scaled weights"""
+        scaled, offsets = SumTree(4), SumTree(4)
+        for index, (weight, offset) in enumerate(((1.0, 1.0), (2.0, 1.0))):
+            scaled[index] = weight
+            offsets[index] = offset
+        self.assertEqual(scaled.find(0.5, 2.0, offsets), 0)
+        self.assertEqual(scaled.find(1.5, 2.0, offsets), 1)
@@ -0,0 +1,41 @@
+import unittest
+
+from copycat.support_graph import SupportGraph
+
+
+class Supporter:
+    """Supports the others in its set, while descriptions are unchanged"""
+
+    version = 0
+
+    def __init__(self, name):
+        self.name = name
+        self.supports = set()
+
+    def descriptions_version(self):
+        return Supporter.version
+
+    def supporting(self, other):
+        return other.name in self.supports
+
+
+class TestSupportGraph(unittest.TestCase):
+    def test_supported(self):
+        """Edges should follow correspondences built, broken and described"""
+        one, two, three = Supporter("one"), Supporter("two"), Supporter("three")
+        one.supports = {"two", "three"}
+        three.supports = {"one"}
+        graph = SupportGraph()
+        graph.add(one)
+        graph.add(two)
+        self.assertEqual(list(graph.supported(one)), [two])
+        self.assertEqual(list(graph.supported(three)), [one])
+        graph.add(three)
+        self.assertEqual(list(graph.supported(one)), [two, three])
+        graph.remove(two)
+        self.assertEqual(list(graph.supported(one)), [three])
+        one.supports = set()
+        self.assertEqual(list(graph.supported(one)), [three])
+        Supporter.version += 1
+        self.assertEqual(list(graph.supported(one)), [])
+        self.assertEqual(list(graph.supported(three)), [one])
@@ -0,0 +1,21 @@
+import unittest
+
+from copycat import tracing
+
+
+class TestTracing(unittest.TestCase):
+    def tearDown(self):
+        tracing.switch_off()
+
+    def test_switches(self):
+        """Categories should be off until switched on, and only those switched"""
+        self.assertFalse(any(tracing.switched_on(_) for _ in tracing.CATEGORIES))
+        tracing.switch_on("temperature")
+        self.assertTrue(tracing.switched_on("temperature"))
+        self.assertFalse(tracing.switched_on("codelets"))
+        with self.assertLogs(level="INFO") as logs:
+            tracing.temperature("temperature: %s", 42)
+            tracing.codelets("not traced")
+        self.assertEqual(logs.output, ["INFO:root:temperature: 42"])
+        tracing.switch_off()
+        self.assertFalse(tracing.switched_on("temperature"))
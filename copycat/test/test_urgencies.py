@@ -0,0 +1,19 @@
+import unittest
+
+from copycat.codelet import Codelet
+from copycat.urgencies import BinnedUrgencies
+
+
+class TestBinnedUrgencies(unittest.TestCase):
+    def test_choose(self):
+        """Only codelets still in a bin should be chosen"""
+        urgencies = BinnedUrgencies()
+        codelets = [Codelet(str(_), _ % 3 + 1, 0) for _ in range(9)]
+        for codelet in codelets:
+            urgencies.add(codelet)
+        for codelet in codelets[:-1]:
+            urgencies.remove(codelet)
+        self.assertEqual([len(_) for _ in urgencies.bins.values()], [0, 0, 1])
+        self.assertIs(urgencies.choose(2.0), codelets[-1])
+        urgencies.remove(codelets[-1])
+        self.assertIsNone(urgencies.choose(2.0))
@@ -0,0 +1,35 @@
+import unittest
+
+from copycat.engine import Engine
+from copycat.workspace_string import WorkspaceString
+
+
+class TestWorkspaceString(unittest.TestCase):
+    def test_neighbours(self):
+        """Objects should be found next to each other by position"""
+        with Engine().activated():
+            string = WorkspaceString("abc")
+        a, b, c = string.letters
+        self.assertEqual(string.objects_left_of(b), [a])
+        self.assertEqual(string.objects_right_of(b), [c])
+        self.assertEqual(string.objects_left_of(a), [])
+        self.assertEqual(string.adjacent_pairs, 2)
+        string.remove_object(c)
+        self.assertEqual(string.objects_right_of(b), [])
+        self.assertEqual(string.adjacent_pairs, 1)
+        self.assertEqual(string.objects, [a, b])
+
+    def test_descriptions(self):
+        """Objects should be found by their descriptors"""
+        engine = Engine()
+        with engine.activated():
+            string = WorkspaceString("abb")
+        slipnet = engine.slipnet
+        a, b, c = string.letters
+        self.assertEqual(a.get_descriptor(slipnet.letter_category), slipnet.letters[0])
+        self.assertEqual(
+            a.get_description_type(slipnet.leftmost), slipnet.string_position_category
+        )
+        self.assertEqual(list(string.objects_described_by(slipnet.letters[1])), [b, c])
+        self.assertTrue(a.distinguishing_descriptor(slipnet.letters[0]))
+        self.assertFalse(b.distinguishing_descriptor(slipnet.letters[1]))
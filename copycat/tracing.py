@@ -0,0 +1,80 @@
+"""Trace what copycat does, by categories which cost nothing until switched on
+
+Each category is a function which ignores its arguments,
+    until the category is switched on, then it logs them
+    slipnet(slipnet): activation of all slipnodes, as each codelet is chosen
+    coderack(codelets): all codelets waiting on the coderack
+    workspace(workspace): letters, objects and bonds of initial and target strings
+    temperature(message, *args): the temperature, as it is used and changed
+    codelets(message, *args): what codelets (and formulas they use) are doing
+
+Messages use the lazy formatting of the logging module,
+    so use tracing.codelets("chose %s", node), not f-strings
+
+Call the categories as attributes of this module (tracing.slipnet(...))
+    so that switching on or off is seen by all callers
+"""
+
+import logging
+
+CATEGORIES = ("slipnet", "coderack", "workspace", "temperature", "codelets")
+
+
+def _ignore(*_args):
+    pass
+
+
+def _log(message, *args):
+    logging.info(message, *args)
+
+
+def _log_slipnet(slipnet):
+    logging.info("Slipnet:")
+    for node in slipnet.slipnodes:
+        logging.info(
+            "\tnode %s, activation: %s, buffer: %s, depth: %s",
+            node.get_name(),
+            node.activation,
+            node.buffer,
+            node.conceptual_depth,
+        )
+
+
+def _log_coderack(codelets):
+    logging.info("Coderack:")
+    for codelet in codelets:
+        logging.info("\t%s, %s", codelet.name, codelet.urgency)
+
+
+def _log_workspace(workspace):
+    workspace.initial.log("Initial: ")
+    workspace.target.log("Target: ")
+
+
+_loggers = {
+    "slipnet": _log_slipnet,
+    "coderack": _log_coderack,
+    "workspace": _log_workspace,
+    "temperature": _log,
+    "codelets": _log,
+}
+
+slipnet = coderack = workspace = temperature = codelets = _ignore
+
+
+def switch_on(*categories):
+    """Start tracing those categories, or all categories if none are given"""
+    for category in categories or CATEGORIES:
+        globals()[category] = _loggers[category]
+
+
+def switch_off(*categories):
+    """Stop tracing those categories, or all categories if none are given"""
+    for category in categories or CATEGORIES:
+        if category not in _loggers:
+            raise KeyError(category)
+        globals()[category] = _ignore
+
+
+def switched_on(category):
+    return globals()[category] is not _ignore
@@ -0,0 +1,78 @@
+"""Hold the urgencies of codelets on the coderack, for choosing one to run
+
+Each codelet is chosen with probability proportional to urgency ** scale
+    where the scale depends on the temperature
+"""
+
+from .engine import random
+from .sum_tree import SumTree
+
+
+class TreeUrgencies:
+    """Weights of codelets kept in a sum-tree, by their index on the coderack"""
+
+    def __init__(self, codelets, capacity):
+        self.codelets = codelets
+        self.tree = SumTree(capacity)
+        self.scale = None
+
+    def add(self, codelet):
+        if self.scale is not None:
+            self.tree[codelet.index] = codelet.urgency**self.scale
+
+    def remove(self, codelet):
+        self.tree[codelet.index] = 0.0
+
+    def rescale(self, scale):
+        """Re-weigh all codelets when the temperature has changed"""
+        self.scale = scale
+        self.tree.fill([_.urgency**scale for _ in self.codelets])
+
+    def choose(self, scale):
+        if scale != self.scale:
+            self.rescale(scale)
+        threshold = self.tree.total() * random.random()
+        index = self.tree.find(threshold)
+        if index < len(self.codelets):
+            return self.codelets[index]
+        return self.codelets[0]
+
+
+class BinnedUrgencies:
+    """Codelets kept in bins of equal urgency
+
+    Choosing a codelet first chooses a bin, weighted by
+        number_of_codelets * urgency ** scale
+    and then chooses uniformly among the codelets in that bin
+    So the work does not grow with the number of codelets
+    """
+
+    def __init__(self):
+        self.bins = {}
+        self.positions = {}
+
+    def add(self, codelet):
+        bin_ = self.bins.setdefault(codelet.urgency, [])
+        self.positions[codelet] = len(bin_)
+        bin_ += [codelet]
+
+    def remove(self, codelet):
+        bin_ = self.bins[codelet.urgency]
+        position = self.positions.pop(codelet)
+        last = bin_.pop()
+        if last is not codelet:
+            bin_[position] = last
+            self.positions[last] = position
+
+    def choose(self, scale):
+        bins = [_ for _ in self.bins.items() if _[1]]
+        if not bins:
+            return None
+        weights = [len(codelets) * urgency**scale for urgency, codelets in bins]
+        threshold = sum(weights) * random.random()
+        total = 0.0
+        for weight, (_urgency, codelets) in zip(weights, bins):
+            total += weight
+            if total > threshold:
+                return random.choice(codelets)
+        return random.choice(bins[0][1])
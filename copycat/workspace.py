@@ -1,9 +1,19 @@
-import logging
+import collections
 
+from . import tracing
+from .bond import Bond
+from .correspondence import Correspondence
+from .engine import random
+from .indexed_set import IndexedSet
+from .letter import Letter
+from .support_graph import SupportGraph
 from .workspace_string import WorkspaceString
 
 unknownAnswer = "?"
 
+# The kinds of objects which are counted as the workspace changes
+COUNTED_KINDS = ("unrelated", "ungrouped", "unreplaced", "uncorresponding")
+
 
 def __adjust_unhappiness(values):
     result = sum(values) / 2
@@ -14,6 +24,10 @@ def __adjust_unhappiness(values):
 
 class Workspace:
     def __init__(self):
+        # if true, check the live counts against a count of all objects
+        self.check_counts = False
+        # if true, update all strengths, checking those whose inputs are unchanged
+        self.check_updates = False
         self.set_strings("", "", "")
         self.reset()
         self.total_unhappiness = 0.0
@@ -35,11 +49,18 @@ class Workspace:
         self.found_answer = False
         self.changed_object = None
         self.objects = []
-        self.structures = []
+        # all structures, in the order they were built
+        self.structures = {}
+        # structures of each type, e.g. self.registry[Bond]
+        self.registry = collections.defaultdict(IndexedSet)
+        self.supports = SupportGraph()
         self.rule = None
         self.initial = WorkspaceString(self.initial_string)
         self.modified = WorkspaceString(self.modified_string)
         self.target = WorkspaceString(self.target_string)
+        self.counts = dict.fromkeys(COUNTED_KINDS, 0)
+        for object_ in self.objects:
+            self.count(object_)
 
     def assess_unhappiness(self):
         self.intra_string_unhappiness = __adjust_unhappiness(
@@ -73,9 +94,11 @@ class Workspace:
 
     def calculate_total_unhappiness(self):
         for object_ in self.objects:
-            logging.info(
-                f"{object_}, total_unhappiness: {object_.total_unhappiness}, "
-                f"relative_importance: {object_.relative_importance * 1000}"
+            tracing.codelets(
+                "%s, total_unhappiness: %s, relative_importance: %s",
+                object_,
+                object_.total_unhappiness,
+                object_.relative_importance * 1000,
             )
         values = [_.relative_importance * _.total_unhappiness for _ in self.objects]
         value = sum(values) / 2.0
@@ -83,7 +106,7 @@ class Workspace:
 
     def update_everything(self):
         for structure in self.structures:
-            structure.update_strength()
+            self.__update_strength(structure)
         for obj in self.objects:
             obj.update_value()
         self.initial.update_relative_importance()
@@ -91,10 +114,86 @@ class Workspace:
         self.initial.update_intra_string_unhappiness()
         self.target.update_intra_string_unhappiness()
 
+    def __update_strength(self, structure):
+        """Update the strength of the structure, if its inputs have changed"""
+        inputs = structure.strength_inputs()
+        if inputs is None or inputs != structure.updated_inputs:
+            structure.update_strength()
+            structure.updated_inputs = inputs
+        elif self.check_updates:
+            strengths = structure.internal_strength, structure.external_strength
+            structure.update_strength()
+            updated = structure.internal_strength, structure.external_strength
+            if updated != strengths:
+                raise ValueError(f"Strength of {structure} changed to {updated}")
+
+    def descriptions_version(self):
+        """Changes whenever a description is added to, or removed from, any string"""
+        return self.initial.version, self.modified.version, self.target.version
+
     def other_objects(self, an_object):
         return [_ for _ in self.objects if _ != an_object]
 
+    def __kinds(self, object_):
+        """Which kinds of object the object is counted as"""
+        if object_.string != self.initial and object_.string != self.target:
+            return ()
+        kinds = ()
+        if not object_.spans_string():
+            if (not object_.left_bond and not object_.leftmost) or (
+                not object_.right_bond and not object_.rightmost
+            ):
+                kinds += ("unrelated",)
+            if not object_.group:
+                kinds += ("ungrouped",)
+        if object_.string == self.initial and isinstance(object_, Letter):
+            if not object_.replacement:
+                kinds += ("unreplaced",)
+        if not object_.correspondence:
+            kinds += ("uncorresponding",)
+        return kinds
+
+    def count(self, object_):
+        """Start counting an object which has been added to the workspace"""
+        object_.counted_as = self.__kinds(object_)
+        for kind in object_.counted_as:
+            self.counts[kind] += 1
+
+    def uncount(self, object_):
+        """Stop counting an object which has been removed from the workspace"""
+        for kind in object_.counted_as or ():
+            self.counts[kind] -= 1
+        object_.counted_as = None
+
+    def recount(self, *objects):
+        """Update the counts after bonds, groups, etc of the objects changed"""
+        for object_ in objects:
+            if object_.counted_as is not None:
+                self.uncount(object_)
+                self.count(object_)
+
+    def __counted(self, kind, scan):
+        if self.check_counts and self.counts[kind] != scan():
+            raise ValueError(f"Counted {self.counts[kind]} {kind}, not {scan()}")
+        return self.counts[kind]
+
     def number_of_unrelated_objects(self):
+        """The number of objects in the workspace with >= 1 open bond slots"""
+        return self.__counted("unrelated", self.__scan_unrelated_objects)
+
+    def number_of_ungrouped_objects(self):
+        """The number of objects in the workspace that have no group"""
+        return self.__counted("ungrouped", self.__scan_ungrouped_objects)
+
+    def number_of_unreplaced_objects(self):
+        """The number of unreplaced letters in the initial string"""
+        return self.__counted("unreplaced", self.__scan_unreplaced_objects)
+
+    def number_of_uncorresponding_objects(self):
+        """The number of objects in the workspace with no correspondence"""
+        return self.__counted("uncorresponding", self.__scan_uncorresponding_objects)
+
+    def __scan_unrelated_objects(self):
         """A list of all objects in the workspace with >= 1 open bond slots"""
         objects = [
             _
@@ -110,7 +209,7 @@ class Workspace:
         ]
         return len(objects)
 
-    def number_of_ungrouped_objects(self):
+    def __scan_ungrouped_objects(self):
         """A list of all objects in the workspace that have no group."""
         objects = [
             _
@@ -121,10 +220,8 @@ class Workspace:
         objects = [_ for _ in objects if not _.group]
         return len(objects)
 
-    def number_of_unreplaced_objects(self):
+    def __scan_unreplaced_objects(self):
         """A list of all unreplaced objects in the inital string"""
-        from .letter import Letter
-
         objects = [
             _
             for _ in self.objects
@@ -133,7 +230,7 @@ class Workspace:
         objects = [_ for _ in objects if not _.replacement]
         return len(objects)
 
-    def number_of_uncorresponding_objects(self):
+    def __scan_uncorresponding_objects(self):
         """A list of all uncorresponded objects in the inital string"""
         objects = [
             _
@@ -143,22 +240,43 @@ class Workspace:
         objects = [_ for _ in objects if not _.correspondence]
         return len(objects)
 
+    def add_structure(self, structure):
+        self.structures[structure] = None
+        self.registry[type(structure)].add(structure)
+
+    def remove_structure(self, structure):
+        """Remove the structure, if it is in the workspace"""
+        if structure in self.structures:
+            del self.structures[structure]
+            self.registry[type(structure)].discard(structure)
+
+    def number_of_structures(self, *types):
+        return sum(len(self.registry[_]) for _ in types)
+
+    def choose_structure(self, *types):
+        """A structure of one of those types chosen at random, or None"""
+        number = self.number_of_structures(*types)
+        if not number:
+            return None
+        index = random.randrange(number)
+        for type_ in types:
+            structures = self.registry[type_]
+            if index < len(structures):
+                return structures[index]
+            index -= len(structures)
+
     def number_of_bonds(self):
         """The number of bonds in the workspace"""
-        from .bond import Bond
-
-        return len([_ for _ in self.structures if isinstance(_, Bond)])
+        return len(self.registry[Bond])
 
     def correspondences(self):
-        from .correspondence import Correspondence
-
-        return [_ for _ in self.structures if isinstance(_, Correspondence)]
+        return self.registry[Correspondence]
 
     def slippages(self):
         result = []
         if self.changed_object and self.changed_object.correspondence:
             result = [_ for _ in self.changed_object.correspondence.concept_mappings]
-        for object_ in workspace.initial.objects:
+        for object_ in self.initial.objects:
             if object_.correspondence:
                 for mapping in object_.correspondence.slippages():
                     if not mapping.is_nearly_contained_by(result):
@@ -167,9 +285,9 @@ class Workspace:
 
     def build_rule(self, rule):
         if self.rule:
-            self.structures.remove(self.rule)
+            self.remove_structure(self.rule)
         self.rule = rule
-        self.structures += [rule]
+        self.add_structure(rule)
         rule.activate_rule_descriptions()
 
     def break_rule(self):
@@ -180,7 +298,4 @@ class Workspace:
             description.description_type.buffer = 100.0
             description.descriptor.buffer = 100.0
             if description not in self.structures:
-                self.structures += [description]
-
-
-workspace = Workspace()
+                self.add_structure(description)
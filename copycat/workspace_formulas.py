@@ -1,9 +1,10 @@
 import logging
 
 from . import formulas
-from .slipnet import slipnet
-from .temperature import temperature
-from .workspace import workspace
+from . import tracing
+from .engine import slipnet
+from .engine import temperature
+from .engine import workspace
 
 
 class WorkspaceFormulas:
@@ -23,17 +24,13 @@ class WorkspaceFormulas:
             formulas.clamp_actual_temperature()
         else:
             formulas.weigh_actual_temperature(values)
-        logging.info(
-            f"unhappiness: {workspace.total_unhappiness + 0.001}, "
-            f"weakness: {rule_weakness + 0.001}"
+        tracing.temperature(
+            "unhappiness: %s, weakness: %s",
+            workspace.total_unhappiness + 0.001,
+            rule_weakness + 0.001,
         )
-        temperature.update(formulas.actual_temperature)
         if not self.clamp_temperature:
-            formulas.Temperature = formulas.actual_temperature
-        temperature.update(formulas.Temperature)
-
-
-workspace_formulas = WorkspaceFormulas()
+            temperature.update(temperature.actual)
 
 
 def number_of_objects():
@@ -48,14 +45,8 @@ def choose_unmodified_object(attribute, in_objects):
 
 
 def choose_neighbour(source):
-    objects = []
-    for object_ in workspace.objects:
-        if object_.string != source.string:
-            continue
-        if object_.left_index == source.right_index + 1:
-            objects += [object_]
-        elif source.left_index == object_.right_index + 1:
-            objects += [object_]
+    string = source.string
+    objects = string.objects_left_of(source) + string.objects_right_of(source)
     return formulas.choose_object_from_list(objects, "intra_string_salience")
 
 
@@ -68,24 +59,12 @@ def choose_directed_neighbor(source, direction):
 
 
 def __choose_left_neighbor(source):
-    objects = []
-    for object_ in workspace.objects:
-        if object_.string == source.string:
-            if source.left_index == object_.right_index + 1:
-                logging.info(f"{object_} is on left of {source}")
-                objects += [object_]
-            else:
-                logging.info("{object_} is not on left of {source}")
-    logging.info(f"Number of left objects: {len(objects)}")
+    objects = source.string.objects_left_of(source)
     return formulas.choose_object_from_list(objects, "intra_string_salience")
 
 
 def __choose_right_neighbor(source):
-    objects = [
-        _
-        for _ in workspace.objects
-        if _.string == source.string and _.left_index == source.right_index + 1
-    ]
+    objects = source.string.objects_right_of(source)
     return formulas.choose_object_from_list(objects, "intra_string_salience")
 
 
@@ -128,7 +107,7 @@ def probability_of_posting(codelet_name):
     if codelet_name == "breaker":
         return 1.0
     if "description" in codelet_name:
-        result = (formulas.Temperature / 100.0) ** 2
+        result = (temperature.value / 100.0) ** 2
     else:
         result = workspace.intra_string_unhappiness / 100.0
     if "correspondence" in codelet_name:
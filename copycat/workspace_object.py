@@ -1,16 +1,51 @@
-import logging
-
+from . import tracing
 from .description import Description
+from .engine import slipnet
+from .engine import workspace
+from .formulas import weighted_average
 from .slipnet import distinguishing_descriptor
-from .slipnet import slipnet
 from .workspace_structure import WorkspaceStructure
 
 
 class WorkspaceObject(WorkspaceStructure):
+    __slots__ = (
+        "descriptions",
+        "descriptions_by_type",
+        "descriptions_by_descriptor",
+        "extrinsic_descriptions",
+        "incoming_bonds",
+        "outgoing_bonds",
+        "bonds",
+        "group",
+        "changed",
+        "correspondence",
+        "clamp_salience",
+        "raw_importance",
+        "relative_importance",
+        "left_bond",
+        "right_bond",
+        "new_answer_letter",
+        "name",
+        "replacement",
+        "counted_as",
+        "right_index",
+        "left_index",
+        "leftmost",
+        "rightmost",
+        "intra_string_salience",
+        "inter_string_salience",
+        "total_salience",
+        "intra_string_unhappiness",
+        "inter_string_unhappiness",
+        "total_unhappiness",
+    )
+
     def __init__(self, workspace_string):
         WorkspaceStructure.__init__(self)
         self.string = workspace_string
         self.descriptions = []
+        self.descriptions_by_type = {}
+        self.descriptions_by_descriptor = {}
         self.extrinsic_descriptions = []
         self.incoming_bonds = []
         self.outgoing_bonds = []
@@ -26,6 +61,7 @@ class WorkspaceObject(WorkspaceStructure):
         self.new_answer_letter = False
         self.name = ""
         self.replacement = None
+        self.counted_as = None
         self.right_index = 0
         self.left_index = 0
         self.leftmost = False
@@ -45,21 +81,43 @@ class WorkspaceObject(WorkspaceStructure):
 
     def add_description(self, description_type, descriptor):
         description = Description(self, description_type, descriptor)
-        logging.info(f"Adding description: {description} to {self}")
+        tracing.codelets("Adding description: %s to %s", description, self)
+        self.append_description(description)
+
+    def append_description(self, description):
+        """Add the description, indexed by its type and its descriptor"""
         self.descriptions += [description]
+        by_type = self.descriptions_by_type.setdefault(description.description_type, [])
+        by_type += [description]
+        by_descriptor = self.descriptions_by_descriptor.setdefault(
+            description.descriptor, []
+        )
+        by_descriptor += [description]
+        if self.string.holds(self):
+            self.string.describe(self, description.descriptor)
+
+    def remove_description(self, description):
+        self.descriptions.remove(description)
+        for index, key in (
+            (self.descriptions_by_type, description.description_type),
+            (self.descriptions_by_descriptor, description.descriptor),
+        ):
+            index[key].remove(description)
+            if not index[key]:
+                del index[key]
+        if self.string.holds(self):
+            self.string.undescribe(self, description.descriptor)
 
     def add_descriptions(self, descriptions):
         copy = descriptions[:]  # in case we add to our own descriptions
         for description in copy:
-            logging.info(f"might add: {description}")
+            tracing.codelets("might add: %s", description)
             if not self.contains_description(description):
                 self.add_description(
                     description.description_type, description.descriptor
                 )
             else:
-                logging.info("Won't add it")
-        from .workspace import workspace
-
+                tracing.codelets("Won't add it")
         workspace.build_descriptions(self)
 
     def __calculate_intra_string_happiness(self):
@@ -108,8 +166,6 @@ class WorkspaceObject(WorkspaceStructure):
             self.intra_string_salience = 100.0
             self.inter_string_salience = 100.0
         else:
-            from .formulas import weighted_average
-
             self.intra_string_salience = weighted_average(
                 ((self.relative_importance, 0.2), (self.intra_string_unhappiness, 0.8))
             )
@@ -119,9 +175,12 @@ class WorkspaceObject(WorkspaceStructure):
         self.total_salience = (
             self.intra_string_salience + self.inter_string_salience
         ) / 2.0
-        logging.info(
-            f"Set salience of {self} to {self.total_salience}"
-            f" = ({self.intra_string_salience} + {self.inter_string_salience}) / 2"
+        tracing.codelets(
+            "Set salience of %s to %s = (%s + %s) / 2",
+            self,
+            self.total_salience,
+            self.intra_string_salience,
+            self.inter_string_salience,
         )
 
     def is_within(self, other):
@@ -134,7 +193,7 @@ class WorkspaceObject(WorkspaceStructure):
         return [_ for _ in self.descriptions if _.description_type.fully_active()]
 
     def get_possible_descriptions(self, description_type):
-        logging.info(f"getting possible descriptions for {self}")
+        tracing.codelets("getting possible descriptions for %s", self)
         descriptions = []
         from .group import Group
 
@@ -152,30 +211,27 @@ class WorkspaceObject(WorkspaceStructure):
                 index += 1
             if node == slipnet.middle and self.middle_object():
                 descriptions += [node]
-        logging.info(", ".join(_.get_name() for _ in descriptions))
+        tracing.codelets("%s", descriptions)
         return descriptions
 
     def contains_description(self, sought):
-        sought_type = sought.description_type
-        sought_descriptor = sought.descriptor
-        for description in self.descriptions:
-            if sought_type == description.description_type:
-                if sought_descriptor == description.descriptor:
-                    return True
-        return False
+        return any(
+            _.description_type == sought.description_type
+            for _ in self.descriptions_by_descriptor.get(sought.descriptor, [])
+        )
 
     def described(self, slipnode):
-        return any(_.descriptor == slipnode for _ in self.descriptions)
+        return slipnode in self.descriptions_by_descriptor
 
     def middle_object(self):
         # only works if string is 3 chars long
         # as we have access to the string, why not just " == len / 2" ?
-        object_on_my_right_is_rightmost = object_on_my_left_is_leftmost = False
-        for object_ in self.string.objects:
-            if object_.leftmost and object_.right_index == self.left_index - 1:
-                object_on_my_left_is_leftmost = True
-            if object_.rightmost and object_.left_index == self.right_index + 1:
-                object_on_my_right_is_rightmost = True
+        object_on_my_left_is_leftmost = any(
+            _.leftmost for _ in self.string.objects_left_of(self)
+        )
+        object_on_my_right_is_rightmost = any(
+            _.rightmost for _ in self.string.objects_right_of(self)
+        )
         return object_on_my_right_is_rightmost and object_on_my_left_is_leftmost
 
     @staticmethod
@@ -191,21 +247,17 @@ class WorkspaceObject(WorkspaceStructure):
 
     def get_descriptor(self, description_type):
         """The description attached to this object of the description type."""
-        descriptor = None
-        logging.info(f"\nIn {self}, trying for type: {description_type.get_name()}")
-        for description in self.descriptions:
-            logging.info(f"Trying description: {description}")
-            if description.description_type == description_type:
-                return description.descriptor
-        return descriptor
+        descriptions = self.descriptions_by_type.get(description_type)
+        if not descriptions:
+            return None
+        return descriptions[0].descriptor
 
     def get_description_type(self, sought_description):
         """The description_type attached to this object of that description"""
-        for description in self.descriptions:
-            if description.descriptor == sought_description:
-                return description.description_type
-        description = None
-        return description
+        descriptions = self.descriptions_by_descriptor.get(sought_description)
+        if not descriptions:
+            return None
+        return descriptions[0].description_type
 
     def get_common_groups(self, other):
         return [
@@ -2,9 +2,11 @@
 
 import logging
 
+from . import tracing
+from .engine import slipnet
+from .engine import workspace
 from .group import Group
 from .letter import Letter
-from .slipnet import slipnet
 
 
 class WorkspaceString:
@@ -13,16 +15,22 @@ class WorkspaceString:
     def __init__(self, string):
         self.string = string
         self.bonds = []
+        self.bonds_by_category = {}
         self.objects = []
+        self.starting_at = {}
+        self.ending_at = {}
+        self.described_by = {}
+        # changed whenever a description is added or removed
+        self.version = 0
+        # changed whenever an object or bond is added or removed
+        self.structures_version = 0
+        self.adjacent_pairs = 0
         self.letters = []
         self.length = len(string)
         self.intra_string_unhappiness = 0.0
         if not self.length:
             return
         position = 0
-
-        from .workspace import workspace
-
         for char in self.string.upper():
             value = ord(char) - ord("A")
             letter = Letter(self, position + 1, self.length)
@@ -56,6 +64,73 @@ class WorkspaceString:
     def __getitem__(self, index):
         return self.string[index]
 
+    def add_object(self, object_):
+        """Add a letter or group to the string, indexed by where it starts and ends"""
+        self.objects += [object_]
+        self.starting_at.setdefault(object_.left_index, []).append(object_)
+        self.ending_at.setdefault(object_.right_index, []).append(object_)
+        self.adjacent_pairs += self.__number_of_neighbours(object_)
+        self.structures_version += 1
+        for description in object_.descriptions:
+            self.describe(object_, description.descriptor)
+
+    def remove_object(self, object_):
+        self.objects.remove(object_)
+        self.starting_at[object_.left_index].remove(object_)
+        self.ending_at[object_.right_index].remove(object_)
+        self.adjacent_pairs -= self.__number_of_neighbours(object_)
+        self.structures_version += 1
+        for description in object_.descriptions:
+            self.undescribe(object_, description.descriptor)
+
+    def holds(self, object_):
+        """Whether the object is (still) one of the string's objects"""
+        return object_ in self.starting_at.get(object_.left_index, [])
+
+    def describe(self, object_, descriptor):
+        """Index one of the object's descriptions by its descriptor"""
+        objects = self.described_by.setdefault(descriptor, {})
+        objects[object_] = objects.get(object_, 0) + 1
+        self.version += 1
+
+    def undescribe(self, object_, descriptor):
+        objects = self.described_by[descriptor]
+        objects[object_] -= 1
+        if not objects[object_]:
+            del objects[object_]
+        self.version += 1
+
+    def objects_described_by(self, descriptor):
+        """Objects of the string with a description using that descriptor"""
+        return self.described_by.get(descriptor, {})
+
+    def __number_of_neighbours(self, object_):
+        return len(self.objects_left_of(object_)) + len(self.objects_right_of(object_))
+
+    def objects_left_of(self, object_):
+        """Objects which end just before the object starts"""
+        return self.ending_at.get(object_.left_index - 1, [])
+
+    def objects_right_of(self, object_):
+        """Objects which start just after the object ends"""
+        return self.starting_at.get(object_.right_index + 1, [])
+
+    def add_bond(self, bond):
+        """Add a bond to the string, indexed by its categories"""
+        self.bonds += [bond]
+        key = bond.category, bond.direction_category
+        self.bonds_by_category.setdefault(key, []).append(bond)
+        self.structures_version += 1
+
+    def remove_bond(self, bond):
+        self.bonds.remove(bond)
+        self.bonds_by_category[bond.category, bond.direction_category].remove(bond)
+        self.structures_version += 1
+
+    def bonds_like(self, bond):
+        """Bonds of the same category and direction as the bond"""
+        return self.bonds_by_category.get((bond.category, bond.direction_category), [])
+
     def update_relative_importance(self):
         """Update the normalised importance of all objects in the string"""
         total = sum(_.raw_importance for _ in self.objects)
@@ -64,10 +139,12 @@ class WorkspaceString:
                 object_.relative_importance = 0.0
         else:
             for object_ in self.objects:
-                logging.info(
-                    f"object: {object_}, "
-                    f"relative: {object_.relative_importance * 1000} = "
-                    f"raw: {object_.raw_importance} / total: {total}"
+                tracing.codelets(
+                    "object: %s, relative: %s = raw: %s / total: %s",
+                    object_,
+                    object_.relative_importance * 1000,
+                    object_.raw_importance,
+                    total,
                 )
                 object_.relative_importance = object_.raw_importance / total
 
@@ -8,17 +8,34 @@ def abstract_call(object_, name):
 
 
 class WorkspaceStructure:
+    __slots__ = (
+        "string",
+        "internal_strength",
+        "external_strength",
+        "total_strength",
+        "updated_inputs",
+    )
+
     def __init__(self):
         self.string = None
         self.internal_strength = 0.0
         self.external_strength = 0.0
         self.total_strength = 0.0
+        # what the strength was last updated from, see strength_inputs()
+        self.updated_inputs = None
 
     def update_strength(self):
         self.update_internal_strength()
         self.update_external_strength()
         self.update_total_strength()
 
+    def strength_inputs(self):
+        """Everything the strength is calculated from, or None if not known
+
+        While these inputs are unchanged the strength need not be updated
+        """
+        return None
+
     def update_total_strength(self):
         """Recalculate the strength from internal and external strengths"""
         weights = (